@@ -316,9 +316,8 @@ class KomorebiAgent:
         if resume_session:
             self._session_id = self._session_manager.load()
 
-        # 初始化 SkillManager
+        # 初始化 SkillManager（連線時組合 system prompt 才掃描目錄）
         self._skill_manager = SkillManager(Path(".claude/skills"))
-        self._skill_manager.discover()
         set_skill_manager(self._skill_manager)
 
         # 初始化 PlanManager
@@ -441,7 +440,7 @@ class KomorebiAgent:
             )
 
         return ClaudeAgentOptions(
-            system_prompt=self._load_system_prompt(),
+            # system_prompt 含 skill 清單，在 __aenter__ 連線前才組合
             # 模型設定
             model=self.model,
             # 預算限制
@@ -486,6 +485,8 @@ class KomorebiAgent:
         Returns:
             Self for use in async with statement.
         """
+        # 組合 system prompt 時才第一次掃描 skills 目錄，建構 agent 不做檔案 I/O
+        self._options.system_prompt = self._load_system_prompt()
         self._client = ClaudeSDKClient(self._options)
         await self._client.connect()
         return self
@@ -11,6 +11,9 @@
 - 透過 load_skill 工具載入完整內容作為上下文
 """
 
+import codecs
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -18,6 +21,63 @@ from typing import Any
 import frontmatter
 from claude_agent_sdk import tool
 
+# skill 目錄至少這麼多個時才用 thread pool 並行讀取
+_PARALLEL_DISCOVERY_MIN = 8
+# discovery 時先讀這麼多 bytes，通常已涵蓋整段 frontmatter
+_FRONTMATTER_PREFIX_BYTES = 2048
+
+
+def _is_boundary(line: str) -> bool:
+    """Return True if line is a frontmatter ``---`` boundary."""
+    stripped = line.rstrip()
+    return stripped.startswith("---") and not stripped.strip("-")
+
+
+def _read_frontmatter_text(path: Path) -> str:
+    """Read just enough of a SKILL.md to cover its frontmatter.
+
+    Reads the first _FRONTMATTER_PREFIX_BYTES bytes and returns the text up
+    to the closing ``---`` line. If the closing line is not in that prefix,
+    the rest of the file is read.
+
+    Args:
+        path: Path to SKILL.md.
+
+    Returns:
+        Text containing the whole frontmatter block (or the whole file).
+
+    Raises:
+        OSError: If the file cannot be read.
+        UnicodeDecodeError: If the file is not valid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with path.open("rb") as f:
+        # 最後一個字元可能被切在中間，incremental decoder 會先保留不解碼
+        head = decoder.decode(f.read(_FRONTMATTER_PREFIX_BYTES))
+        lines = head.split("\n")
+        if lines[0].lstrip().startswith("---"):
+            # 最後一行可能不完整，不拿來判斷結尾分隔線
+            for end in range(1, len(lines) - 1):
+                if _is_boundary(lines[end]):
+                    return "\n".join(lines[: end + 1])
+        return head + decoder.decode(f.read(), final=True)
+
+
+def _read_skill_metadata(skill_file: Path) -> dict[str, Any] | None:
+    """Read the frontmatter of one SKILL.md.
+
+    Args:
+        skill_file: Path to SKILL.md.
+
+    Returns:
+        Frontmatter metadata, or None if the file is missing or unparsable.
+    """
+    try:
+        return frontmatter.loads(_read_frontmatter_text(skill_file)).metadata
+    except Exception:
+        # 沒有 SKILL.md 或無法解析時略過
+        return None
+
 
 @dataclass
 class SkillInfo:
@@ -65,42 +125,75 @@ class SkillManager:
         """
         self._skills_dir = skills_dir or Path(".claude/skills")
         self._skills: dict[str, SkillInfo] = {}
+        # 尚未 discover 時，第一次需要 skill 清單才掃描
+        self._discovered = False
+        # get_skill_list_prompt 的結果，discover() 後重新產生
+        self._prompt_cache: str | None = None
 
     def discover(self) -> list[SkillInfo]:
         """掃描 skills 目錄，只讀取 frontmatter（name + description）。
 
         只在啟動時執行一次，避免每次對話都重新掃描。
+        不需要預先呼叫：其他方法第一次使用時會自動執行。
 
         Returns:
             List of discovered SkillInfo objects.
         """
-        if not self._skills_dir.exists():
+        self._discovered = True
+        self._prompt_cache = None
+        try:
+            entries = os.scandir(self._skills_dir)
+        except OSError:
             return []
 
-        for skill_dir in self._skills_dir.iterdir():
-            if skill_dir.is_dir():
-                skill_file = skill_dir / "SKILL.md"
-                if skill_file.exists():
-                    try:
-                        post = frontmatter.load(skill_file)
-                        name = post.get("name", skill_dir.name)
-                        self._skills[name] = SkillInfo(
-                            name=name,
-                            description=post.get("description", ""),
-                            path=skill_file,
-                        )
-                    except Exception:
-                        # 忽略無法解析的 SKILL.md
-                        pass
+        with entries:
+            # DirEntry.is_dir() 直接使用 readdir 的結果，不必另外 stat
+            skill_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+        skill_files = [Path(skill_dir) / "SKILL.md" for skill_dir in skill_dirs]
+        if len(skill_files) >= _PARALLEL_DISCOVERY_MIN:
+            # skill 很多時以 thread 重疊檔案 I/O；少量時直接讀比建立 thread 快
+            with ThreadPoolExecutor(max_workers=min(8, len(skill_files))) as pool:
+                metadata = list(pool.map(_read_skill_metadata, skill_files))
+        else:
+            metadata = [_read_skill_metadata(skill_file) for skill_file in skill_files]
+
+        for skill_file, post in zip(skill_files, metadata):
+            if post is None:
+                continue
+            name = post.get("name", skill_file.parent.name)
+            self._skills[name] = SkillInfo(
+                name=name,
+                description=post.get("description", ""),
+                path=skill_file,
+            )
 
         return list(self._skills.values())
 
+    def _ensure_discovered(self) -> None:
+        """Run discover() on first use if it has not been called yet."""
+        if not self._discovered:
+            self.discover()
+
     def get_skill_list_prompt(self) -> str:
         """生成 skill 清單 prompt，嵌入 system prompt。
 
+        結果會快取到下一次 discover()。
+
         Returns:
             Markdown 格式的 skill 清單，如果沒有 skill 則回傳空字串。
         """
+        self._ensure_discovered()
+        if self._prompt_cache is None:
+            self._prompt_cache = self._build_skill_list_prompt()
+        return self._prompt_cache
+
+    def _build_skill_list_prompt(self) -> str:
+        """Build the skill list prompt from the discovered skills.
+
+        Returns:
+            Markdown skill table, or an empty string if there are no skills.
+        """
         if not self._skills:
             return ""
 
@@ -130,6 +223,7 @@ class SkillManager:
         Returns:
             完整的 SKILL.md 內容，如果找不到則回傳 None。
         """
+        self._ensure_discovered()
         skill = self._skills.get(name)
         if not skill:
             return None
@@ -141,6 +235,7 @@ class SkillManager:
         Returns:
             Skill 名稱列表。
         """
+        self._ensure_discovered()
         return list(self._skills.keys())
 
 
@@ -12,21 +12,32 @@
 - generate_review: 統一的回顧報告生成（day/week/month）
 """
 
+import asyncio
 import calendar as cal_module
 import logging
+import os
 import re
-from datetime import datetime, timedelta
+from contextlib import aclosing
+from datetime import date, datetime, time, timedelta
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
+import frontmatter
 import yaml
 from claude_agent_sdk import ClaudeAgentOptions, query, tool
 from claude_agent_sdk.types import ResultMessage
 from pydantic import BaseModel, Field
 
-from ..utils.git import get_commits_in_range, get_today_commits, run_git_command
-from ..utils.markdown import load_frontmatter, read_file_safely, save_frontmatter
+from ..utils.git import get_commits_in_range, get_today_commits_multi, run_git_command
+from ..utils.markdown import (
+    load_frontmatter,
+    load_frontmatter_readonly,
+    read_file_safely,
+    save_frontmatter,
+    write_file_atomic,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,14 +88,23 @@ class GenerateReviewInput(BaseModel):
     notes: str | None = Field(default=None, description="補充筆記（day 模式使用）")
 
 
+# 專案狀態對應的顯示圖示
+_STATUS_EMOJI = {
+    ProjectStatus.ACTIVE.value: "🟢",
+    ProjectStatus.PAUSED.value: "⏸️",
+    ProjectStatus.COMPLETED.value: "✅",
+    ProjectStatus.ARCHIVED.value: "📦",
+}
+
 # 專案資料目錄
 _data_dir: Path = Path("data")
 
 
 def set_data_dir(path: Path) -> None:
     """Set the data directory for project tools."""
-    global _data_dir
+    global _data_dir, _scan_cache
     _data_dir = path
+    _scan_cache = None
 
 
 def _get_projects_dir() -> Path:
@@ -135,25 +155,75 @@ def _get_tasks_path(project_name: str) -> Path | None:
     return tasks_path if tasks_path.exists() else None
 
 
-def _iter_all_projects() -> list[tuple[str, Path]]:
-    """Iterate over all projects (folder mode only).
+# (project_name, project_md_path, tasks_md_path or None)
+_ProjectEntry = tuple[str, Path, Path | None]
+
+
+# 上次掃描結果：(projects_dir, projects_dir mtime, ((子資料夾, mtime), ...), 結果)
+# 新增/刪除專案資料夾會改變 projects_dir 的 mtime；
+# 在資料夾內新增/刪除 project.md、tasks.md 會改變該子資料夾的 mtime
+_scan_cache: tuple[Path, int, tuple[tuple[str, int], ...], list[_ProjectEntry]] | None = None
+
+
+def _scan_projects() -> list[_ProjectEntry]:
+    """Scan all project folders once (folder mode only).
+
+    使用 os.scandir：資料夾/檔案判斷直接取自 readdir 結果，
+    不必對 project.md、tasks.md 各做一次 stat。
+    目錄結構沒有變動時（以各資料夾 mtime 判斷）直接沿用上次的結果。
 
     Returns:
-        List of (project_name, project_md_path) tuples.
+        List of (project_name, project_md_path, tasks_md_path or None) tuples.
     """
+    global _scan_cache
     projects_dir = _get_projects_dir()
-    results: list[tuple[str, Path]] = []
 
-    if not projects_dir.exists():
+    try:
+        # 先取 mtime 再掃描：掃描期間若有變動，下次比對就會不一致而重新掃描
+        dir_mtime = os.stat(projects_dir).st_mtime_ns
+    except OSError:
+        return []
+
+    cached = _scan_cache
+    if cached is not None and cached[0] == projects_dir and cached[1] == dir_mtime:
+        try:
+            unchanged = all(os.stat(path).st_mtime_ns == mtime for path, mtime in cached[2])
+        except OSError:
+            unchanged = False
+        if unchanged:
+            return list(cached[3])
+
+    results: list[_ProjectEntry] = []
+    subdirs: list[tuple[str, int]] = []
+
+    try:
+        entries = os.scandir(projects_dir)
+    except OSError:
         return results
 
-    for item in projects_dir.iterdir():
-        if item.is_dir():
-            project_md = item / "project.md"
-            if project_md.exists():
-                results.append((item.name, project_md))
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            subdirs.append((entry.path, entry.stat().st_mtime_ns))
+            with os.scandir(entry.path) as files:
+                names = {f.name for f in files if f.is_file()}
+            if "project.md" in names:
+                folder = Path(entry.path)
+                tasks_md = folder / "tasks.md" if "tasks.md" in names else None
+                results.append((entry.name, folder / "project.md", tasks_md))
+
+    _scan_cache = (projects_dir, dir_mtime, tuple(subdirs), results)
+    return list(results)
+
 
-    return results
+def _iter_all_projects() -> list[tuple[str, Path]]:
+    """Iterate over all projects (folder mode only).
+
+    Returns:
+        List of (project_name, project_md_path) tuples.
+    """
+    return [(name, project_md) for name, project_md, _ in _scan_projects()]
 
 
 # ============================================================================
@@ -161,6 +231,74 @@ def _iter_all_projects() -> list[tuple[str, Path]]:
 # ============================================================================
 
 
+# tasks.md 的 section 標題（小寫）對應到任務分類
+_SECTION_MAP = {
+    "進行中": "in_progress",
+    "in progress": "in_progress",
+    "待處理": "pending",
+    "pending": "pending",
+    "todo": "pending",
+    "已完成": "completed",
+    "completed": "completed",
+    "done": "completed",
+}
+
+# 同一個 pattern 同時用來取出標籤 (findall) 與移除標籤 (sub)
+_TAG_RE = re.compile(r"\s*#(\S+)")
+# 進行中 section 的標題文字（只做保守的存在判斷，誤判時仍會完整解析）
+_IN_PROGRESS_BYTES_RE = re.compile("in progress|進行中".encode(), re.IGNORECASE)
+
+
+def _split_checkbox(line: str) -> tuple[bool, str] | None:
+    """Split a stripped task line like ``- [x] text`` into its parts.
+
+    以字串操作取代 regex：任務行很短，逐字判斷比 regex 回溯便宜。
+
+    Args:
+        line: Line with surrounding whitespace already stripped.
+
+    Returns:
+        (checked, text) with text stripped and non-empty, or None if the
+        line is not a task.
+    """
+    if line[:1] != "-":
+        return None
+    rest = line[1:].lstrip()
+    if len(rest) < 4 or rest[0] != "[" or rest[2] != "]" or rest[1] not in " xX":
+        return None
+    text = rest[3:].lstrip()
+    if not text:
+        return None
+    return rest[1] != " ", text
+
+
+def _split_completed_date(text: str) -> tuple[str, str | None]:
+    """Split a trailing ``(YYYY-MM-DD)`` completion date off task text.
+
+    Args:
+        text: Stripped, non-empty task text.
+
+    Returns:
+        (text, date) where date is None if there is no trailing date.
+    """
+    if text[-1:] != ")" or len(text) < 13 or text[-12] != "(":
+        return text, None
+    date = text[-11:-1]
+    if not (
+        date[4] == "-"
+        and date[7] == "-"
+        and date[:4].isdecimal()
+        and date[5:7].isdecimal()
+        and date[8:].isdecimal()
+    ):
+        return text, None
+    # 日期前面至少要有一個字元的任務文字
+    head = text[:-12].rstrip()
+    if not head:
+        return text, None
+    return head, date
+
+
 def _parse_tasks(tasks_content: str) -> dict[str, list[dict[str, Any]]]:
     """Parse tasks.md content into structured data.
 
@@ -177,43 +315,32 @@ def _parse_tasks(tasks_content: str) -> dict[str, list[dict[str, Any]]]:
     }
 
     current_section = "pending"
-    section_map = {
-        "進行中": "in_progress",
-        "in progress": "in_progress",
-        "待處理": "pending",
-        "pending": "pending",
-        "todo": "pending",
-        "已完成": "completed",
-        "completed": "completed",
-        "done": "completed",
-    }
-
-    task_pattern = re.compile(
-        r"^-\s*\[([ xX])\]\s*"  # checkbox
-        r"(.+?)"  # task text
-        r"(?:\s*\((\d{4}-\d{2}-\d{2})\))?\s*$"  # optional date
-    )
 
     for line in tasks_content.split("\n"):
         line = line.strip()
 
         if line.startswith("## "):
             section_name = line[3:].strip().lower()
-            if section_name in section_map:
-                current_section = section_map[section_name]
+            if section_name in _SECTION_MAP:
+                current_section = _SECTION_MAP[section_name]
             continue
 
-        match = task_pattern.match(line)
-        if match:
-            checked = match.group(1).lower() == "x"
-            text = match.group(2).strip()
-            completed_date = match.group(3)
+        task_parts = _split_checkbox(line)
+        if task_parts:
+            checked, text = task_parts
+            text, completed_date = _split_completed_date(text)
 
-            tags = re.findall(r"#(\S+)", text)
-            text_clean = re.sub(r"\s*#\S+", "", text).strip()
+            # 多數任務沒有標籤或 @today，先用 in 判斷再跑 regex / replace
+            if "#" in text:
+                tags = _TAG_RE.findall(text)
+                text_clean = _TAG_RE.sub("", text).strip()
+            else:
+                tags = []
+                text_clean = text
 
             is_today = "@today" in text
-            text_clean = text_clean.replace("@today", "").strip()
+            if is_today:
+                text_clean = text_clean.replace("@today", "").strip()
 
             task = {
                 "text": text_clean,
@@ -232,25 +359,161 @@ def _parse_tasks(tasks_content: str) -> dict[str, list[dict[str, Any]]]:
     return result
 
 
+def _count_task_lines(tasks_content: str) -> dict[str, int]:
+    """Count tasks per section without building task dicts.
+
+    Applies the same section and checkbox rules as _parse_tasks.
+
+    Args:
+        tasks_content: Content of tasks.md file.
+
+    Returns:
+        Dictionary with task counts.
+    """
+    counts = {"in_progress": 0, "pending": 0, "completed": 0}
+    current_section = "pending"
+
+    for line in tasks_content.split("\n"):
+        line = line.strip()
+
+        if line.startswith("## "):
+            current_section = _SECTION_MAP.get(line[3:].strip().lower(), current_section)
+            continue
+
+        task_parts = _split_checkbox(line)
+        if task_parts:
+            counts["completed" if task_parts[0] else current_section] += 1
+
+    counts["total"] = counts["in_progress"] + counts["pending"] + counts["completed"]
+    return counts
+
+
+# ============================================================================
+# Cached File Loading
+# ============================================================================
+
+
+def _read_text_if_exists(path: Path) -> str | None:
+    """Read a UTF-8 text file, returning None if it does not exist.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        File content, or None if the file is missing.
+    """
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _stat_key(path: Path) -> tuple[str, int, int]:
+    """Build a cache key that changes whenever the file changes.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Tuple of (path string, mtime in ns, size in bytes).
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    st = path.stat()
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=512)
+def _parse_tasks_by_key(path_str: str, mtime_ns: int, size: int) -> dict[str, list[dict[str, Any]]]:
+    """Parse tasks.md for a (path, mtime, size) key. See _load_tasks_cached."""
+    return _parse_tasks(Path(path_str).read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=512)
+def _count_tasks_by_key(path_str: str, mtime_ns: int, size: int) -> dict[str, int]:
+    """Count tasks in tasks.md for a (path, mtime, size) key. See _count_tasks."""
+    return _count_task_lines(Path(path_str).read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=512)
+def _may_have_today_tasks_by_key(path_str: str, mtime_ns: int, size: int) -> bool:
+    """Check tasks.md bytes for a (path, mtime, size) key. See _load_today_tasks_cached."""
+    data = Path(path_str).read_bytes()
+    # 沒有 @today 也沒有進行中 section 的檔案不會貢獻任何任務
+    return b"@today" in data or _IN_PROGRESS_BYTES_RE.search(data) is not None
+
+
+def _load_tasks_cached(tasks_path: Path) -> dict[str, list[dict[str, Any]]]:
+    """Read and parse a tasks.md file, reusing the result while the file is unchanged.
+
+    回傳的結構會被多次呼叫共用，只能讀取，不可修改。
+
+    Args:
+        tasks_path: Path to tasks.md.
+
+    Returns:
+        Parsed tasks (see _parse_tasks).
+    """
+    return _parse_tasks_by_key(*_stat_key(tasks_path))
+
+
+def _load_today_tasks_cached(tasks_path: Path) -> dict[str, list[dict[str, Any]]] | None:
+    """Parse a tasks.md file only if it can contain today's or in-progress tasks.
+
+    A byte-level check skips files without ``@today`` and without an
+    in-progress section. The result is cached while the file is unchanged
+    and must not be modified.
+
+    Args:
+        tasks_path: Path to tasks.md.
+
+    Returns:
+        Parsed tasks (see _parse_tasks), or None if the file has none of
+        the tasks get_today_tasks reports.
+    """
+    key = _stat_key(tasks_path)
+    if not _may_have_today_tasks_by_key(*key):
+        return None
+    # 與 show_project 等共用同一份解析結果
+    return _parse_tasks_by_key(*key)
+
+
 def _count_tasks(project_path: Path) -> dict[str, int]:
     """Count tasks for a project.
 
+    Only counts are computed (no task dicts), cached while tasks.md is unchanged.
+
     Args:
         project_path: Path to project.md file.
 
     Returns:
         Dictionary with task counts.
     """
-    counts = {"total": 0, "completed": 0, "in_progress": 0, "pending": 0}
-
     tasks_path = project_path.parent / "tasks.md"
-    if tasks_path.exists():
-        tasks = _parse_tasks(tasks_path.read_text(encoding="utf-8"))
-        counts["in_progress"] = len(tasks["in_progress"])
-        counts["pending"] = len(tasks["pending"])
-        counts["completed"] = len(tasks["completed"])
-        counts["total"] = counts["in_progress"] + counts["pending"] + counts["completed"]
+    try:
+        key = _stat_key(tasks_path)
+    except FileNotFoundError:
+        return {"total": 0, "completed": 0, "in_progress": 0, "pending": 0}
+    # 回傳副本，避免呼叫端修改到快取內容
+    return dict(_count_tasks_by_key(*key))
+
+
+def _tally_tasks(parsed: dict[str, list[dict[str, Any]]]) -> dict[str, int]:
+    """Count already-parsed tasks by section.
 
+    Args:
+        parsed: Parsed tasks (see _parse_tasks).
+
+    Returns:
+        Dictionary with task counts.
+    """
+    counts = {
+        "in_progress": len(parsed["in_progress"]),
+        "pending": len(parsed["pending"]),
+        "completed": len(parsed["completed"]),
+    }
+    counts["total"] = counts["in_progress"] + counts["pending"] + counts["completed"]
     return counts
 
 
@@ -263,7 +526,18 @@ def _calculate_progress(project_path: Path) -> int:
     Returns:
         Progress percentage (0-100).
     """
-    counts = _count_tasks(project_path)
+    return _progress_from_counts(_count_tasks(project_path))
+
+
+def _progress_from_counts(counts: dict[str, int]) -> int:
+    """Calculate progress percentage from task counts.
+
+    Args:
+        counts: Task counts (see _count_tasks).
+
+    Returns:
+        Progress percentage (0-100).
+    """
     if counts["total"] == 0:
         return 0
     return int((counts["completed"] / counts["total"]) * 100)
@@ -274,6 +548,41 @@ def _calculate_progress(project_path: Path) -> int:
 # ============================================================================
 
 
+def _load_project_summary(name: str, project_path: Path) -> dict[str, Any]:
+    """Read one project's frontmatter and task counts for list_projects.
+
+    Args:
+        name: Project folder name.
+        project_path: Path to project.md.
+
+    Returns:
+        Summary dict with name, type, status, priority, progress and tasks.
+    """
+    try:
+        # 只讀取 frontmatter，不修改，可以共用快取的 Post
+        post = load_frontmatter_readonly(project_path)
+        task_counts = _count_tasks(project_path)
+    except OSError as e:
+        logger.warning(f"Failed to read {project_path}: {e}")
+        return {
+            "name": name,
+            "type": "unknown",
+            "status": "error: file read failed",
+            "priority": 999,
+            "progress": 0,
+            "tasks": {"total": 0, "completed": 0},
+        }
+
+    return {
+        "name": post.get("name", name),
+        "type": post.get("type", "software"),
+        "status": post.get("status", "unknown"),
+        "priority": post.get("priority", 999),
+        "progress": post.get("progress", _progress_from_counts(task_counts)),
+        "tasks": task_counts,
+    }
+
+
 @tool(
     name="list_projects",
     description="列出所有專案及其狀態、進度統計。回傳專案名稱、狀態、優先順序、任務完成率等摘要資訊。",
@@ -291,35 +600,15 @@ async def list_projects(args: dict[str, Any]) -> dict[str, Any]:
             "is_error": True,
         }
 
-    projects: list[dict[str, Any]] = []
-
-    for name, project_path in _iter_all_projects():
-        try:
-            post = load_frontmatter(project_path)
-            task_counts = _count_tasks(project_path)
-
-            projects.append(
-                {
-                    "name": post.get("name", name),
-                    "type": post.get("type", "software"),
-                    "status": post.get("status", "unknown"),
-                    "priority": post.get("priority", 999),
-                    "progress": post.get("progress", _calculate_progress(project_path)),
-                    "tasks": task_counts,
-                }
-            )
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to read {project_path}: {e}")
-            projects.append(
-                {
-                    "name": name,
-                    "type": "unknown",
-                    "status": "error: file read failed",
-                    "priority": 999,
-                    "progress": 0,
-                    "tasks": {"total": 0, "completed": 0},
-                }
+    # 各專案的 project.md / tasks.md 在 thread 中並行讀取
+    projects = list(
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(_load_project_summary, name, project_path)
+                for name, project_path in _iter_all_projects()
             )
+        )
+    )
 
     if not projects:
         return {
@@ -330,12 +619,7 @@ async def list_projects(args: dict[str, Any]) -> dict[str, Any]:
 
     lines = ["## 專案列表\n"]
     for p in projects:
-        status_emoji = {
-            "active": "🟢",
-            "paused": "⏸️",
-            "completed": "✅",
-            "archived": "📦",
-        }.get(p["status"], "❓")
+        status_emoji = _STATUS_EMOJI.get(p["status"], "❓")
 
         stats_parts = []
         if p["tasks"]["total"] > 0:
@@ -381,17 +665,19 @@ async def show_project(args: dict[str, Any]) -> dict[str, Any]:
             "is_error": True,
         }
 
-    content = project_path.read_text(encoding="utf-8")
+    # 檔案讀取丟到 thread 並行執行，不阻塞 event loop
+    folder_path = project_path.parent
+    content, tasks_content, file_names = await asyncio.gather(
+        asyncio.to_thread(project_path.read_text, encoding="utf-8"),
+        asyncio.to_thread(_read_text_if_exists, folder_path / "tasks.md"),
+        asyncio.to_thread(os.listdir, folder_path),
+    )
 
-    tasks_path = project_path.parent / "tasks.md"
-    if tasks_path.exists():
-        tasks_content = tasks_path.read_text(encoding="utf-8")
+    if tasks_content is not None:
         content += f"\n\n---\n\n# 任務清單 (tasks.md)\n\n{tasks_content}"
 
-    folder_path = project_path.parent
-    files = list(folder_path.iterdir())
     content += f"\n\n---\n\n**專案資料夾**: `{folder_path}`\n"
-    content += f"**檔案**: {', '.join(f.name for f in files)}"
+    content += f"**檔案**: {', '.join(file_names)}"
 
     return {
         "content": [{"type": "text", "text": content}],
@@ -408,40 +694,43 @@ async def get_today_tasks(args: dict[str, Any]) -> dict[str, Any]:
     today_tasks: list[dict[str, Any]] = []
     in_progress_tasks: list[dict[str, Any]] = []
 
-    for name, project_path in _iter_all_projects():
-        tasks_path = project_path.parent / "tasks.md"
-        if not tasks_path.exists():
-            continue
+    # 各專案的 tasks.md 在 thread 中並行讀取與解析（結果依檔案 mtime 快取）
+    entries = [(name, tasks_md) for name, _, tasks_md in _scan_projects() if tasks_md is not None]
+    results = await asyncio.gather(
+        *(asyncio.to_thread(_load_today_tasks_cached, tasks_md) for _, tasks_md in entries),
+        return_exceptions=True,
+    )
 
-        try:
-            tasks_content = tasks_path.read_text(encoding="utf-8")
-            parsed = _parse_tasks(tasks_content)
+    for (name, _), parsed in zip(entries, results):
+        if isinstance(parsed, OSError):
+            logger.warning(f"Failed to read tasks for {name}: {parsed}")
+            continue
+        if isinstance(parsed, BaseException):
+            raise parsed
+        if parsed is None:
+            continue
 
-            for task in parsed["pending"] + parsed["in_progress"]:
+        for section in ("pending", "in_progress"):
+            for task in parsed[section]:
                 if task.get("is_today"):
                     today_tasks.append(
                         {
                             "project": name,
                             "text": task["text"],
                             "tags": task.get("tags", []),
-                            "section": "in_progress"
-                            if task in parsed["in_progress"]
-                            else "pending",
+                            "section": section,
                         }
                     )
 
-            for task in parsed["in_progress"]:
-                if not task.get("is_today"):
-                    in_progress_tasks.append(
-                        {
-                            "project": name,
-                            "text": task["text"],
-                            "tags": task.get("tags", []),
-                        }
-                    )
-
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to read tasks for {name}: {e}")
+        for task in parsed["in_progress"]:
+            if not task.get("is_today"):
+                in_progress_tasks.append(
+                    {
+                        "project": name,
+                        "text": task["text"],
+                        "tags": task.get("tags", []),
+                    }
+                )
 
     lines = ["## 今日任務\n"]
 
@@ -527,13 +816,19 @@ async def _collect_repo_info(repo_path: Path, full_analysis: bool = False) -> di
         deps_file = repo_path / "package.json"
     info["dependencies"] = read_file_safely(deps_file, max_chars=2000)
 
-    info["structure"] = await run_git_command(
-        repo_path,
-        ["-c", "core.quotepath=false", "ls-tree", "-r", "--name-only", "HEAD"],
+    # 兩個 git 指令互不相依，同時執行以重疊 process 啟動與 IO 的延遲
+    git_log_args = (
+        ["log", "--oneline", "-50"] if full_analysis else ["log", "--since=7 days ago", "--oneline"]
+    )
+    info["structure"], info["git_log"] = await asyncio.gather(
+        run_git_command(
+            repo_path,
+            ["-c", "core.quotepath=false", "ls-tree", "-r", "--name-only", "HEAD"],
+        ),
+        run_git_command(repo_path, git_log_args),
     )
 
     if full_analysis:
-        info["git_log"] = await run_git_command(repo_path, ["log", "--oneline", "-50"])
         other_docs = []
         for doc_name in ["TECHNICAL.md", "API_SPEC.md", "ARCHITECTURE.md"]:
             doc_content = read_file_safely(repo_path / doc_name, max_chars=2000)
@@ -541,9 +836,6 @@ async def _collect_repo_info(repo_path: Path, full_analysis: bool = False) -> di
                 other_docs.append(f"### {doc_name}\n{doc_content}")
         info["other_docs"] = "\n\n".join(other_docs) if other_docs else "(無)"
     else:
-        info["git_log"] = await run_git_command(
-            repo_path, ["log", "--since=7 days ago", "--oneline"]
-        )
         info["other_docs"] = "(sync mode: 略過)"
 
     return info
@@ -790,7 +1082,26 @@ def _get_date_range(period: ReviewPeriod, date_str: str | None) -> tuple[datetim
     Returns:
         Tuple of (start_date, end_date, label).
     """
-    today = datetime.now()
+    # 未指定日期時以今天為基準；把今天放進 cache key，結果在同一天內可重用
+    today = None if date_str else date.today()
+    return _compute_date_range(period, date_str, today)
+
+
+@lru_cache(maxsize=64)
+def _compute_date_range(
+    period: ReviewPeriod, date_str: str | None, today_date: date | None
+) -> tuple[datetime, datetime, str]:
+    """Compute start/end dates and label for a review period (memoized).
+
+    Args:
+        period: Review period (day/week/month).
+        date_str: Optional date string.
+        today_date: Reference date used when date_str is None.
+
+    Returns:
+        Tuple of (start_date, end_date, label).
+    """
+    today = datetime.combine(today_date, time()) if today_date else datetime.now()
 
     if period == ReviewPeriod.DAY:
         if date_str:
@@ -805,7 +1116,12 @@ def _get_date_range(period: ReviewPeriod, date_str: str | None) -> tuple[datetim
         if date_str:
             year = int(date_str[:4])
             week = int(date_str[6:])
-            start = datetime.strptime(f"{year}-W{week:02d}-1", "%Y-W%W-%w")
+            # %W 週數：第 1 週從當年第一個週一開始，第 0 週是它之前的那幾天
+            jan1 = datetime(year, 1, 1)
+            if week == 0:
+                start = jan1 - timedelta(days=jan1.weekday())
+            else:
+                start = jan1 + timedelta(days=(7 - jan1.weekday()) % 7 + 7 * (week - 1))
         else:
             start = today - timedelta(days=today.weekday())
             start = start.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -828,61 +1144,177 @@ def _get_date_range(period: ReviewPeriod, date_str: str | None) -> tuple[datetim
     return start, end, label
 
 
-async def _collect_completed_tasks_in_range(
-    start_date: datetime, end_date: datetime
-) -> dict[str, list[dict[str, Any]]]:
-    """Collect completed tasks within a date range."""
-    results: dict[str, list[dict[str, Any]]] = {}
+def _load_completed_tasks(
+    name: str, tasks_path: Path | None, start_date: datetime, end_date: datetime
+) -> list[dict[str, Any]]:
+    """Read one project's tasks.md and return tasks completed within a date range.
 
-    for name, project_path in _iter_all_projects():
-        tasks_path = project_path.parent / "tasks.md"
-        if not tasks_path.exists():
-            continue
+    Runs in a worker thread (blocking file I/O + parsing).
+    """
+    if tasks_path is None:
+        return []
+
+    try:
+        parsed = _load_tasks_cached(tasks_path)
+    except (OSError, IOError) as e:
+        logger.warning(f"Failed to read tasks for {name}: {e}")
+        return []
+
+    return _filter_completed_in_range(parsed, start_date, end_date)
 
+
+def _filter_completed_in_range(
+    parsed: dict[str, list[dict[str, Any]]], start_date: datetime, end_date: datetime
+) -> list[dict[str, Any]]:
+    """Pick completed tasks whose completed_date falls within a date range.
+
+    Args:
+        parsed: Parsed tasks (see _parse_tasks).
+        start_date: Start of the range.
+        end_date: End of the range.
+
+    Returns:
+        Completed tasks within the range.
+    """
+    # completed_date 是 YYYY-MM-DD，ISO 日期字串的字典序即時間順序，
+    # 直接比較字串即可，不需要逐筆解析成 date
+    start_s = start_date.strftime("%Y-%m-%d")
+    end_s = end_date.strftime("%Y-%m-%d")
+
+    return [
+        task
+        for task in parsed["completed"]
+        if (d := task.get("completed_date")) and start_s <= d <= end_s
+    ]
+
+
+def _load_project_bundle(
+    project_path: Path,
+    tasks_path: Path | None,
+) -> tuple[frontmatter.Post, dict[str, list[dict[str, Any]]], dict[str, int], int]:
+    """Load a project's frontmatter and tasks once for the month review.
+
+    Runs in a worker thread (blocking file I/O + parsing).
+
+    Args:
+        project_path: Path to project.md file.
+        tasks_path: Path to tasks.md, or None if the project has none.
+
+    Returns:
+        Tuple of (post, parsed tasks, task counts, progress percentage).
+    """
+    post = load_frontmatter_readonly(project_path)
+
+    parsed = _parse_tasks("")
+    if tasks_path:
         try:
-            tasks_content = tasks_path.read_text(encoding="utf-8")
-            parsed = _parse_tasks(tasks_content)
+            parsed = _load_tasks_cached(tasks_path)
+        except (OSError, ValueError) as e:
+            # 單一專案的 tasks.md 讀取失敗時視為沒有任務，不中斷整份月回顧
+            logger.warning(f"Failed to read {tasks_path}: {e}")
+    counts = _tally_tasks(parsed)
 
-            completed_in_range = []
-            for task in parsed["completed"]:
-                if "completed_date" in task:
-                    task_date = datetime.strptime(task["completed_date"], "%Y-%m-%d")
-                    if start_date <= task_date <= end_date:
-                        completed_in_range.append(task)
+    return post, parsed, counts, _progress_from_counts(counts)
 
-            if completed_in_range:
-                results[name] = completed_in_range
 
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to read tasks for {name}: {e}")
+async def _collect_completed_tasks_in_range(
+    start_date: datetime,
+    end_date: datetime,
+    projects: list[_ProjectEntry] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Collect completed tasks within a date range.
+
+    每個專案的 tasks.md 讀取與解析丟到 thread 並行執行，避免阻塞 event loop。
+
+    Args:
+        start_date: Start of the range.
+        end_date: End of the range.
+        projects: Pre-scanned project entries (see _scan_projects); scans when None.
+
+    Returns:
+        Completed tasks keyed by project name.
+    """
+    if projects is None:
+        projects = _scan_projects()
+    loaded = await asyncio.gather(
+        *(
+            asyncio.to_thread(_load_completed_tasks, name, tasks_path, start_date, end_date)
+            for name, _, tasks_path in projects
+        )
+    )
 
-    return results
+    return {name: tasks for (name, _, _), tasks in zip(projects, loaded) if tasks}
 
 
 async def _collect_all_commits_in_range(
-    start_date: datetime, end_date: datetime
+    start_date: datetime,
+    end_date: datetime,
+    projects: list[_ProjectEntry] | None = None,
 ) -> dict[str, list[str]]:
-    """Collect git commits for all projects within a date range."""
-    commits_summary: dict[str, list[str]] = {}
+    """Collect git commits for all projects within a date range.
 
-    for name, project_path in _iter_all_projects():
-        post = load_frontmatter(project_path)
+    Args:
+        start_date: Start of the range.
+        end_date: End of the range.
+        projects: Pre-scanned project entries (see _scan_projects); scans when None.
+
+    Returns:
+        Commit lines keyed by project name.
+    """
+    if projects is None:
+        projects = _scan_projects()
+
+    repos: list[tuple[str, Path]] = []
+    for name, project_path, _ in projects:
+        post = load_frontmatter_readonly(project_path)
         repo_path_str = post.get("repo", "")
         if repo_path_str:
             repo_path = Path(repo_path_str).expanduser()
             if repo_path.exists():
-                commits = await get_commits_in_range(repo_path, start_date, end_date)
-                if commits and commits[0]:  # Filter empty results
-                    commits_summary[name] = commits
+                repos.append((name, repo_path))
+
+    # 每個 repo 一個 git log，所有 repo 並行執行
+    results = await asyncio.gather(
+        *(get_commits_in_range(repo_path, start_date, end_date) for _, repo_path in repos)
+    )
+
+    return {
+        name: commits
+        for (name, _), commits in zip(repos, results)
+        if commits and commits[0]  # Filter empty results
+    }
 
-    return commits_summary
+
+_REFLECTION_PROMPT = """根據以下本週完成的工作，生成 3-5 個反思問題。
+
+本週工作摘要：
+{summary}
+
+請直接輸出問題，每個問題一行，用 "- " 開頭。繁體中文。"""
+
+# 工作摘要 → 反思問題（只保留最近幾筆，重新產生同一週回顧時不必再呼叫模型）
+_REFLECTION_CACHE_SIZE = 32
+_reflection_cache: dict[str, str] = {}
+
+
+@cache
+def _get_reflection_options() -> ClaudeAgentOptions:
+    """Build the reflection-question model options on first use, then reuse them."""
+    return ClaudeAgentOptions(model="claude-haiku-3-5-20241022")
 
 
 async def _generate_reflection_questions(
     completed_tasks: dict[str, list[dict[str, Any]]],
     commits_summary: dict[str, list[str]],
 ) -> str:
-    """Use AI to generate reflection questions."""
+    """Use AI to generate reflection questions.
+
+    沒有任何完成任務或 commits 時直接回傳預設問題，不呼叫模型；
+    同樣的工作摘要會重用先前產生的問題。
+    """
+    if not any(completed_tasks.values()) and not any(commits_summary.values()):
+        return "- 本週沒有完成的任務，下週有什麼想要達成的目標？"
+
     summary_parts = []
     for project, tasks in completed_tasks.items():
         task_texts = [t["text"] for t in tasks]
@@ -892,45 +1324,104 @@ async def _generate_reflection_questions(
         if commits:
             summary_parts.append(f"**{project}** commits: {len(commits)} 筆")
 
-    if not summary_parts:
-        return "- 本週沒有完成的任務，下週有什麼想要達成的目標？"
+    summary = "\n".join(summary_parts)
+    cached = _reflection_cache.get(summary)
+    if cached:
+        return cached
 
-    prompt = f"""根據以下本週完成的工作，生成 3-5 個反思問題。
+    prompt = _REFLECTION_PROMPT.format(summary=summary)
 
-本週工作摘要：
-{chr(10).join(summary_parts)}
+    result_text = ""
 
-請直接輸出問題，每個問題一行，用 "- " 開頭。繁體中文。"""
+    # aclosing 確保 break 後 generator 立即關閉，不殘留背景連線
+    async with aclosing(query(prompt=prompt, options=_get_reflection_options())) as messages:
+        async for message in messages:
+            if isinstance(message, ResultMessage):
+                if hasattr(message, "result") and message.result:
+                    result_text = message.result
+                    break
 
-    options = ClaudeAgentOptions(model="claude-haiku-3-5-20241022")
-    result_text = ""
+    if not result_text:
+        return "- 本週有什麼讓你感到自豪的成就？\n- 下週最重要的一件事是什麼？"
 
-    async for message in query(prompt=prompt, options=options):
-        if isinstance(message, ResultMessage):
-            if hasattr(message, "result") and message.result:
-                result_text = message.result
-                break
+    if len(_reflection_cache) >= _REFLECTION_CACHE_SIZE:
+        _reflection_cache.pop(next(iter(_reflection_cache)))
+    _reflection_cache[summary] = result_text
+    return result_text
+
+
+# 週/月回顧的固定版面，只有 {} 欄位每次產生時填入
+_WEEK_REVIEW_TEMPLATE = """# 週回顧 {label}
 
-    return result_text or "- 本週有什麼讓你感到自豪的成就？\n- 下週最重要的一件事是什麼？"
+**期間**: {start} ~ {end}
+**生成時間**: {generated_at}
+
+## 完成的任務
+
+{tasks_section}## Git Commits 摘要
+
+{commits_section}## 反思問題
+
+{reflection}
+"""
+
+# 「學習與成長」「下月目標」留給使用者手動填寫（"- " 後的空白是刻意保留的）
+_MONTH_REVIEW_TEMPLATE = """# 月回顧 {month_name}
+
+**期間**: {start} ~ {end}
+**生成時間**: {generated_at}
+
+## 專案進度總覽
+
+{progress_section}
+## 月度成就清單
+
+{achievements_section}
+
+## 學習與成長
+
+<!-- 手動填寫本月學到的新技術、概念或技能 -->
+-\x20
+
+## 下月目標
+
+<!-- 手動填寫下個月想要達成的目標 -->
+-\x20
+"""
+
+
+def _format_commit_lines(commits_by_project: dict[str, list[str]]) -> tuple[list[str], int]:
+    """Format commits as "- project: commit" markdown lines.
+
+    Args:
+        commits_by_project: Commits keyed by project name.
+
+    Returns:
+        Tuple of (markdown list lines or a placeholder line, total commit count).
+    """
+    commit_lines: list[str] = []
+    total_commits = 0
+    for proj_name, commits in commits_by_project.items():
+        total_commits += len(commits)
+        commit_lines.extend(f"- {proj_name}: {commit}" for commit in commits)
+    return commit_lines or ["- (今日無 commits)"], total_commits
 
 
 def _update_daily_note_review(
     daily_file: Path,
-    commits_by_project: dict[str, list[str]],
+    commit_lines: list[str],
     notes: str | None,
 ) -> None:
-    """Update daily note with end-of-day review section."""
+    """Update daily note with end-of-day review section.
+
+    Args:
+        daily_file: Path to the daily note.
+        commit_lines: Pre-formatted commit lines (see _format_commit_lines).
+        notes: Optional notes for the review.
+    """
     post = load_frontmatter(daily_file)
     now = datetime.now()
 
-    commit_lines: list[str] = []
-    for proj_name, commits in commits_by_project.items():
-        for commit in commits:
-            commit_lines.append(f"- {proj_name}: {commit}")
-
-    if not commit_lines:
-        commit_lines.append("- (今日無 commits)")
-
     review_section = f"""## 日終回顧
 ### Git Commits
 {chr(10).join(commit_lines)}
@@ -944,12 +1435,9 @@ def _update_daily_note_review(
 
     post["updated_at"] = now.isoformat()
 
-    content = post.content
-    if "## 日終回顧" in content:
-        parts = content.split("## 日終回顧")
-        content = parts[0] + review_section
-    else:
-        content = content + "\n" + review_section
+    # partition 只掃描一次；保留第一個「## 日終回顧」之前的內容
+    head, sep, _ = post.content.partition("## 日終回顧")
+    content = head + review_section if sep else head + "\n" + review_section
 
     post.content = content
     save_frontmatter(daily_file, post)
@@ -995,26 +1483,26 @@ async def generate_review(args: dict[str, Any]) -> dict[str, Any]:
             }
 
         # Collect today's commits
-        commits_by_project: dict[str, list[str]] = {}
+        repos: list[tuple[str, Path]] = []
         for name, project_path in _iter_all_projects():
-            post = load_frontmatter(project_path)
+            post = load_frontmatter_readonly(project_path)
             repo_path_str = post.get("repo", "")
             if repo_path_str:
                 repo_path = Path(repo_path_str).expanduser()
                 if repo_path.exists():
-                    commits = await get_today_commits(repo_path)
-                    if commits and commits[0]:
-                        commits_by_project[name] = commits
-
-        _update_daily_note_review(daily_file, commits_by_project, validated.notes)
+                    repos.append((name, repo_path))
 
-        total_commits = sum(len(c) for c in commits_by_project.values())
-        commit_lines = []
-        for proj_name, commits in commits_by_project.items():
-            for commit in commits:
-                commit_lines.append(f"- {proj_name}: {commit}")
-        if not commit_lines:
-            commit_lines.append("- (今日無 commits)")
+        commits_by_repo = await get_today_commits_multi([repo_path for _, repo_path in repos])
+        commits_by_project: dict[str, list[str]] = {}
+        for name, repo_path in repos:
+            commits = commits_by_repo[repo_path]
+            if commits and commits[0]:
+                commits_by_project[name] = commits
+
+        commit_lines, total_commits = _format_commit_lines(commits_by_project)
+        await asyncio.to_thread(
+            _update_daily_note_review, daily_file, commit_lines, validated.notes
+        )
 
         return {
             "content": [
@@ -1034,57 +1522,49 @@ async def generate_review(args: dict[str, Any]) -> dict[str, Any]:
         }
 
     # ========== Week / Month Review ==========
-    completed_tasks = await _collect_completed_tasks_in_range(start_date, end_date)
-    commits_summary = await _collect_all_commits_in_range(start_date, end_date)
+    # 專案目錄只掃描一次，供後續各個 pass 共用
+    projects = _scan_projects()
+    commits_summary = await _collect_all_commits_in_range(start_date, end_date, projects)
 
     if period == ReviewPeriod.WEEK:
+        completed_tasks = await _collect_completed_tasks_in_range(start_date, end_date, projects)
         reflection = await _generate_reflection_questions(completed_tasks, commits_summary)
 
-        lines = [
-            f"# 週回顧 {label}",
-            "",
-            f"**期間**: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
-            f"**生成時間**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "",
-            "## 完成的任務",
-            "",
-        ]
-
         if completed_tasks:
-            for project, tasks in completed_tasks.items():
-                lines.append(f"### {project}")
-                for task in tasks:
-                    date_str = task.get("completed_date", "")
-                    lines.append(f"- [x] {task['text']} ({date_str})")
-                lines.append("")
+            tasks_section = "".join(
+                f"### {project}\n"
+                + "".join(f"- [x] {t['text']} ({t.get('completed_date', '')})\n" for t in tasks)
+                + "\n"
+                for project, tasks in completed_tasks.items()
+            )
         else:
-            lines.append("_本週沒有標記完成的任務_")
-            lines.append("")
-
-        lines.append("## Git Commits 摘要")
-        lines.append("")
+            tasks_section = "_本週沒有標記完成的任務_\n\n"
 
         if commits_summary:
-            for project, commits in commits_summary.items():
-                lines.append(f"### {project} ({len(commits)} commits)")
-                for commit in commits[:10]:
-                    lines.append(f"- {commit}")
-                if len(commits) > 10:
-                    lines.append(f"- ... 共 {len(commits)} 筆")
-                lines.append("")
+            commits_section = "".join(
+                f"### {project} ({len(commits)} commits)\n"
+                + "".join(f"- {commit}\n" for commit in commits[:10])
+                + (f"- ... 共 {len(commits)} 筆\n" if len(commits) > 10 else "")
+                + "\n"
+                for project, commits in commits_summary.items()
+            )
         else:
-            lines.append("_本週沒有 commits_")
-            lines.append("")
-
-        lines.append("## 反思問題")
-        lines.append("")
-        lines.append(reflection)
-        lines.append("")
+            commits_section = "_本週沒有 commits_\n\n"
+
+        content = _WEEK_REVIEW_TEMPLATE.format(
+            label=label,
+            start=start_date.strftime("%Y-%m-%d"),
+            end=end_date.strftime("%Y-%m-%d"),
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            tasks_section=tasks_section,
+            commits_section=commits_section,
+            reflection=reflection,
+        )
 
         reviews_dir = _get_reviews_dir() / "weekly"
         reviews_dir.mkdir(parents=True, exist_ok=True)
         review_file = reviews_dir / f"{label}.md"
-        review_file.write_text("\n".join(lines), encoding="utf-8")
+        await asyncio.to_thread(write_file_atomic, review_file, content.encode("utf-8"))
 
         total_tasks = sum(len(tasks) for tasks in completed_tasks.values())
         total_commits = sum(len(commits) for commits in commits_summary.values())
@@ -1108,38 +1588,35 @@ async def generate_review(args: dict[str, Any]) -> dict[str, Any]:
         }
 
     else:  # MONTH
+        # 每個專案只讀一次，同時產出完成任務與進度統計
+        bundles = await asyncio.gather(
+            *(
+                asyncio.to_thread(_load_project_bundle, project_path, tasks_path)
+                for _, project_path, tasks_path in projects
+            )
+        )
+
+        completed_tasks = {}
         project_progress: list[dict[str, Any]] = []
 
-        for name, project_path in _iter_all_projects():
-            post = load_frontmatter(project_path)
-            task_counts = _count_tasks(project_path)
+        for (name, _, _), (post, parsed, task_counts, progress) in zip(projects, bundles):
+            completed_in_range = _filter_completed_in_range(parsed, start_date, end_date)
+            if completed_in_range:
+                completed_tasks[name] = completed_in_range
 
             project_info = {
                 "name": post.get("name", name),
                 "status": post.get("status", "unknown"),
-                "progress": post.get("progress", _calculate_progress(project_path)),
+                "progress": post.get("progress", progress),
                 "tasks": task_counts,
             }
             project_progress.append(project_info)
 
         month_name = start_date.strftime("%Y 年 %m 月")
-        lines = [
-            f"# 月回顧 {month_name}",
-            "",
-            f"**期間**: {start_date.strftime('%Y-%m-%d')} ~ {end_date.strftime('%Y-%m-%d')}",
-            f"**生成時間**: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "",
-            "## 專案進度總覽",
-            "",
-        ]
 
+        progress_lines = []
         for proj in project_progress:
-            status_emoji = {
-                "active": "🟢",
-                "paused": "⏸️",
-                "completed": "✅",
-                "archived": "📦",
-            }.get(proj["status"], "❓")
+            status_emoji = _STATUS_EMOJI.get(proj["status"], "❓")
 
             tasks = proj["tasks"]
             task_str = (
@@ -1148,40 +1625,34 @@ async def generate_review(args: dict[str, Any]) -> dict[str, Any]:
             commits_count = len(commits_summary.get(proj["name"].lower(), []))
             commits_str = f", {commits_count} commits" if commits_count > 0 else ""
 
-            lines.append(f"- {status_emoji} **{proj['name']}**: {task_str}{commits_str}")
-
-        lines.append("")
-        lines.append("## 月度成就清單")
-        lines.append("")
+            progress_lines.append(f"- {status_emoji} **{proj['name']}**: {task_str}{commits_str}\n")
+        progress_section = "".join(progress_lines)
 
         if completed_tasks:
-            total_count = 0
-            for project, tasks in completed_tasks.items():
-                lines.append(f"### {project}")
-                for task in tasks:
-                    lines.append(f"- [x] {task['text']}")
-                    total_count += 1
-                lines.append("")
-            lines.append(f"**共完成 {total_count} 項任務**")
+            total_count = sum(len(tasks) for tasks in completed_tasks.values())
+            achievements_section = (
+                "".join(
+                    f"### {project}\n" + "".join(f"- [x] {t['text']}\n" for t in tasks) + "\n"
+                    for project, tasks in completed_tasks.items()
+                )
+                + f"**共完成 {total_count} 項任務**"
+            )
         else:
-            lines.append("_本月沒有標記完成的任務_")
-
-        lines.append("")
-        lines.append("## 學習與成長")
-        lines.append("")
-        lines.append("<!-- 手動填寫本月學到的新技術、概念或技能 -->")
-        lines.append("- ")
-        lines.append("")
-        lines.append("## 下月目標")
-        lines.append("")
-        lines.append("<!-- 手動填寫下個月想要達成的目標 -->")
-        lines.append("- ")
-        lines.append("")
+            achievements_section = "_本月沒有標記完成的任務_"
+
+        content = _MONTH_REVIEW_TEMPLATE.format(
+            month_name=month_name,
+            start=start_date.strftime("%Y-%m-%d"),
+            end=end_date.strftime("%Y-%m-%d"),
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            progress_section=progress_section,
+            achievements_section=achievements_section,
+        )
 
         reviews_dir = _get_reviews_dir() / "monthly"
         reviews_dir.mkdir(parents=True, exist_ok=True)
         review_file = reviews_dir / f"{label}.md"
-        review_file.write_text("\n".join(lines), encoding="utf-8")
+        await asyncio.to_thread(write_file_atomic, review_file, content.encode("utf-8"))
 
         total_tasks = sum(len(tasks) for tasks in completed_tasks.values())
         total_commits = sum(len(commits) for commits in commits_summary.values())
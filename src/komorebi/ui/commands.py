@@ -32,23 +32,7 @@ async def handle_command(screen: "ChatScreen", message: str) -> None:
     command = parts[0].lower()
     args = parts[1] if len(parts) > 1 else ""
 
-    handlers = {
-        "/help": _handle_help,
-        "/usage": _handle_usage,
-        "/clear": _handle_clear,
-        "/exit": _handle_exit,
-        "/quit": _handle_exit,
-        "/q": _handle_exit,
-        "/sync": _handle_sync,
-        "/projects": _handle_projects,
-        "/today": _handle_today,
-        "/plan": _handle_plan,
-        "/approve": _handle_approve,
-        "/reject": _handle_reject,
-        "/mode": _handle_mode,
-    }
-
-    handler = handlers.get(command)
+    handler = _HANDLERS.get(command)
     if handler:
         await handler(screen, args)
     else:
@@ -165,3 +149,21 @@ async def _handle_reject(screen: "ChatScreen", args: str) -> None:
 async def _handle_mode(screen: "ChatScreen", args: str) -> None:
     """Show current mode status."""
     screen.show_mode_status()
+
+
+# 指令對照表（模組層級，避免每次 dispatch 重建）
+_HANDLERS = {
+    "/help": _handle_help,
+    "/usage": _handle_usage,
+    "/clear": _handle_clear,
+    "/exit": _handle_exit,
+    "/quit": _handle_exit,
+    "/q": _handle_exit,
+    "/sync": _handle_sync,
+    "/projects": _handle_projects,
+    "/today": _handle_today,
+    "/plan": _handle_plan,
+    "/approve": _handle_approve,
+    "/reject": _handle_reject,
+    "/mode": _handle_mode,
+}
@@ -4,12 +4,15 @@ Main conversation interface with message history, input, and status bar.
 """
 
 import asyncio
+import logging
+from functools import cache
 from typing import TYPE_CHECKING
 
 from textual import events
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header, Static
 
 from textual.reactive import reactive
@@ -23,6 +26,7 @@ from ..widgets import (
     ThinkingIndicator,
     ToolPanel,
 )
+from ..widgets.message_view import RoleType
 from ...agent import (
     DoneEvent,
     KomorebiAgent,
@@ -35,55 +39,68 @@ from ...agent import (
 if TYPE_CHECKING:
     from ..app import KomorebiApp
 
+logger = logging.getLogger(__name__)
+
+# 成功的 tool panel 移除前保留的秒數
+TOOL_PANEL_LINGER = 0.5
+# /clear 時最多保留重用的 MessageView 數量
+MESSAGE_POOL_SIZE = 32
+
+
+@cache
+def _get_app_cls() -> type["KomorebiApp"]:
+    """Import KomorebiApp once (deferred to avoid a circular import)."""
+    from ..app import KomorebiApp
+
+    return KomorebiApp
+
 
 class SmoothScroll(VerticalScroll):
-    """VerticalScroll with aggressive throttling for Mac trackpad.
+    """VerticalScroll that coalesces Mac trackpad scroll bursts.
 
     Mac trackpads generate 40+ events per gesture with momentum scrolling.
-    This class uses throttling (250ms) to make scrolling controllable.
+    Instead of dropping events inside the throttle window (250ms), this class
+    accumulates their deltas and flushes a single scroll per window.
     """
 
     SCROLL_AMOUNT = 1  # Lines per scroll event
-    SCROLL_THROTTLE = 0.25  # 250ms between scroll events
+    SCROLL_THROTTLE = 0.25  # 250ms between scroll flushes
 
     def __init__(self, *args, **kwargs) -> None:
-        """Initialize with scroll throttle tracking."""
+        """Initialize with scroll accumulation tracking."""
         super().__init__(*args, **kwargs)
-        self._last_scroll_time: float = 0.0
-
-    def _on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
-        """Handle scroll down with aggressive throttling."""
-        import time
+        # 視窗內累積的捲動量，由 timer 一次送出
+        self._pending_dy: int = 0
+        self._flush_handle: Timer | None = None
 
-        now = time.monotonic()
-        if now - self._last_scroll_time < self.SCROLL_THROTTLE:
-            event.stop()
-            event.prevent_default()
-            return
-
-        self._last_scroll_time = now
+    def _queue_scroll(self, event: events.MouseEvent, dy: int) -> None:
+        """Accumulate a scroll delta and schedule a flush if none is pending.
 
-        if self.allow_vertical_scroll:
-            self.scroll_relative(y=self.SCROLL_AMOUNT, animate=False)
+        Args:
+            event: The mouse scroll event to consume.
+            dy: Lines to scroll (negative scrolls up).
+        """
         event.stop()
         event.prevent_default()
+        self._pending_dy += dy
+        if self._flush_handle is None:
+            self._flush_handle = self.set_timer(self.SCROLL_THROTTLE, self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Apply the accumulated scroll delta in a single call."""
+        dy = self._pending_dy
+        self._pending_dy = 0
+        self._flush_handle = None
+        if dy and self.allow_vertical_scroll:
+            self.scroll_relative(y=dy, animate=False)
 
-    def _on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
-        """Handle scroll up with aggressive throttling."""
-        import time
-
-        now = time.monotonic()
-        if now - self._last_scroll_time < self.SCROLL_THROTTLE:
-            event.stop()
-            event.prevent_default()
-            return
-
-        self._last_scroll_time = now
+    def _on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
+        """Handle scroll down by accumulating the delta."""
+        self._queue_scroll(event, self.SCROLL_AMOUNT)
 
-        if self.allow_vertical_scroll:
-            self.scroll_relative(y=-self.SCROLL_AMOUNT, animate=False)
-        event.stop()
-        event.prevent_default()
+    def _on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
+        """Handle scroll up by accumulating the delta."""
+        self._queue_scroll(event, -self.SCROLL_AMOUNT)
 
 
 class StatusBar(Static):
@@ -112,6 +129,9 @@ class StatusBar(Static):
         self._output_tokens: int = 0
         self._plan_mode: bool = False
         self._plan_task: str = ""
+        self._plan_task_display: str = ""
+        # 上次輸出的文字，內容相同時跳過 update()
+        self._last_rendered: str = ""
 
     def update_stats(self, cost: float, input_tokens: int, output_tokens: int) -> None:
         """Update statistics display.
@@ -135,6 +155,8 @@ class StatusBar(Static):
         """
         self._plan_mode = active
         self._plan_task = task
+        # Truncate task if too long (only recomputed when the task changes)
+        self._plan_task_display = task[:40] + "..." if len(task) > 40 else task
         if active:
             self.add_class("plan-mode")
         else:
@@ -144,18 +166,20 @@ class StatusBar(Static):
     def _refresh_display(self) -> None:
         """Refresh the status bar text."""
         if self._plan_mode:
-            # Truncate task if too long
-            task_display = (
-                self._plan_task[:40] + "..." if len(self._plan_task) > 40 else self._plan_task
+            text = (
+                f" PLAN MODE | {self._plan_task_display} | ${self._cost:.4f} | /approve or /reject"
             )
-            self.update(f" PLAN MODE | {task_display} | ${self._cost:.4f} | /approve or /reject")
         else:
-            self.update(
+            text = (
                 f" ${self._cost:.4f} | "
                 f" {self._input_tokens:,} | "
                 f" {self._output_tokens:,} | "
                 "/help for commands"
             )
+        if text == self._last_rendered:
+            return
+        self._last_rendered = text
+        self.update(text)
 
 
 class ChatScreen(Screen):
@@ -206,29 +230,53 @@ class ChatScreen(Screen):
         self._agent: KomorebiAgent | None = None
         self._current_message: MessageView | None = None
         # Use dict to track all tool panels by tool_id
+        # (str 的 hash 由 CPython 快取在物件上，不需另外轉成 int key)
         self._tool_panels: dict[str, ToolPanel] = {}
+        # 尚未 mount 的 tool panel（同一批 ToolStartEvent）
+        self._pending_panels: list[ToolPanel] = []
+        # /clear 後隱藏保留的 MessageView，供之後的訊息重用
+        self._message_pool: list[MessageView] = []
+        # 常用 widget 參照，於 on_mount 快取以避免每個事件重新 query
+        self._chat_input: ChatInput | None = None
+        self._palette: CommandPalette | None = None
+        self._status_bar: StatusBar | None = None
+        self._container: SmoothScroll | None = None
+        # 同一個 frame 內最多排一次 scroll_end
+        self._scroll_pending: bool = False
+        self._cached_app: KomorebiApp | None = None
+        # 訊息依序交給單一背景 task 處理，不必每次建立 worker
+        self._chat_queue: asyncio.Queue[str] = asyncio.Queue()
+        self._chat_task: asyncio.Task[None] | None = None
 
     @property
     def komorebi_app(self) -> "KomorebiApp":
         """Get the app instance."""
-        from ..app import KomorebiApp
+        if self._cached_app is not None:
+            return self._cached_app
 
         app = self.app
-        if not isinstance(app, KomorebiApp):
+        if not isinstance(app, _get_app_cls()):
             raise RuntimeError("Invalid app type")
+        # 型別檢查只做一次，之後直接回傳
+        self._cached_app = app
         return app
 
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
         yield Header()
         yield SmoothScroll(id="chat-container")
-        yield CommandPalette()
+        # CommandPalette 延遲到第一次輸入 / 時才 mount
         yield ChatInput(id="chat-input")
         yield StatusBar()
         yield Footer()
 
     async def on_mount(self) -> None:
         """Called when screen is mounted."""
+        # Cache widget references before anything can dispatch events
+        self._chat_input = self.query_one("#chat-input", ChatInput)
+        self._status_bar = self.query_one(StatusBar)
+        self._container = self.query_one("#chat-container", SmoothScroll)
+
         # Initialize agent
         app = self.komorebi_app
         self._agent = KomorebiAgent(
@@ -239,8 +287,11 @@ class ChatScreen(Screen):
         # Enter async context
         await self._agent.__aenter__()
 
+        # Start the background chat consumer
+        self._chat_task = asyncio.create_task(self._chat_consumer())
+
         # Focus input
-        self.query_one("#chat-input", ChatInput).focus()
+        self._chat_input.focus()
 
         # Welcome message
         self._add_system_message(
@@ -249,18 +300,26 @@ class ChatScreen(Screen):
 
     async def on_unmount(self) -> None:
         """Called when screen is unmounted."""
+        if self._chat_task is not None:
+            self._chat_task.cancel()
+            self._chat_task = None
         if self._agent:
             await self._agent.__aexit__(None, None, None)
             self._agent = None
 
-    def on_chat_input_slash_typed(self, event: ChatInput.SlashTyped) -> None:
+    async def on_chat_input_slash_typed(self, event: ChatInput.SlashTyped) -> None:
         """Handle slash command typing.
 
         Args:
             event: The slash typed event.
         """
-        palette = self.query_one(CommandPalette)
-        chat_input = self.query_one("#chat-input", ChatInput)
+        palette = self._palette
+        chat_input = self._chat_input
+
+        # Mount the palette on first use
+        if palette is None:
+            palette = self._palette = CommandPalette()
+            await self.mount(palette, before=chat_input)
 
         # Update filter and show if not already visible
         if not palette.is_visible:
@@ -273,11 +332,13 @@ class ChatScreen(Screen):
 
     def on_chat_input_slash_cleared(self, event: ChatInput.SlashCleared) -> None:
         """Handle slash command cleared."""
-        palette = self.query_one(CommandPalette)
-        chat_input = self.query_one("#chat-input", ChatInput)
+        self._hide_palette()
 
-        palette.hide()
-        chat_input.palette_visible = False
+    def _hide_palette(self) -> None:
+        """Hide the command palette (if mounted) and sync the input state."""
+        if self._palette is not None:
+            self._palette.hide()
+        self._chat_input.palette_visible = False
 
     def on_command_palette_command_selected(self, event: CommandPalette.CommandSelected) -> None:
         """Handle command selection from palette.
@@ -285,49 +346,43 @@ class ChatScreen(Screen):
         Args:
             event: The command selected event.
         """
-        chat_input = self.query_one("#chat-input", ChatInput)
-        palette = self.query_one(CommandPalette)
+        chat_input = self._chat_input
 
         # Preserve user's full input if it starts with the selected command
         # e.g., "/sync layerwise" should not become just "/sync"
-        current_text = chat_input.text.strip()
-        if current_text.startswith(event.command):
-            final_text = current_text
+        # 只比對指令長度的前綴，不對整個輸入做 strip()
+        raw = chat_input.text
+        command = event.command
+        n = len(command)
+        if raw[:n] == command and (len(raw) == n or raw[n] in " \t"):
+            final_text = raw.rstrip()
         else:
-            final_text = event.command
+            final_text = command
 
         chat_input.set_text(final_text)
-        chat_input.palette_visible = False
-        palette.hide()
+        self._hide_palette()
 
         # Submit the command
         chat_input.post_message(ChatInput.Submitted(final_text))
 
     def key_up(self, event) -> None:
         """Handle up key for command palette navigation."""
-        chat_input = self.query_one("#chat-input", ChatInput)
-        if chat_input.palette_visible:
-            palette = self.query_one(CommandPalette)
-            palette.move_up()
+        if self._chat_input.palette_visible and self._palette is not None:
+            self._palette.move_up()
             event.stop()
             event.prevent_default()
 
     def key_down(self, event) -> None:
         """Handle down key for command palette navigation."""
-        chat_input = self.query_one("#chat-input", ChatInput)
-        if chat_input.palette_visible:
-            palette = self.query_one(CommandPalette)
-            palette.move_down()
+        if self._chat_input.palette_visible and self._palette is not None:
+            self._palette.move_down()
             event.stop()
             event.prevent_default()
 
     def key_escape(self, event) -> None:
         """Handle escape key to hide command palette."""
-        chat_input = self.query_one("#chat-input", ChatInput)
-        if chat_input.palette_visible:
-            palette = self.query_one(CommandPalette)
-            palette.hide()
-            chat_input.palette_visible = False
+        if self._chat_input.palette_visible:
+            self._hide_palette()
             event.stop()
             event.prevent_default()
 
@@ -349,21 +404,20 @@ class ChatScreen(Screen):
         if task:
             self.enter_plan_mode(task)
         # Refocus input
-        self.query_one("#chat-input", ChatInput).focus()
+        self._chat_input.focus()
 
     def on_chat_input_enter_pressed(self, event: ChatInput.EnterPressed) -> None:
         """Handle Enter key when palette is visible."""
-        palette = self.query_one(CommandPalette)
-        chat_input = self.query_one("#chat-input", ChatInput)
+        palette = self._palette
+        chat_input = self._chat_input
 
         # If palette has highlighted option, select it
         # Otherwise, submit the current input directly
-        if palette.is_visible and palette.has_highlighted():
+        if palette is not None and palette.is_visible and palette.has_highlighted():
             palette.select_highlighted()
         else:
             # No matching command, submit as-is
-            palette.hide()
-            chat_input.palette_visible = False
+            self._hide_palette()
             text = chat_input.text.strip()
             if text:
                 chat_input.post_message(ChatInput.Submitted(text))
@@ -379,11 +433,9 @@ class ChatScreen(Screen):
             return
 
         # Hide palette if visible
-        palette = self.query_one(CommandPalette)
-        chat_input = self.query_one("#chat-input", ChatInput)
-        if palette.is_visible:
-            palette.hide()
-            chat_input.palette_visible = False
+        chat_input = self._chat_input
+        if self._palette is not None and self._palette.is_visible:
+            self._hide_palette()
 
         # Clear input
         chat_input.clear()
@@ -396,8 +448,21 @@ class ChatScreen(Screen):
         # Add user message to chat
         self._add_user_message(message)
 
-        # Run chat processing in background worker to keep UI responsive
-        self.run_worker(self._process_chat(message), exclusive=True)
+        # Queue for the background consumer to keep UI responsive
+        self._chat_queue.put_nowait(message)
+
+    async def _chat_consumer(self) -> None:
+        """Process queued chat messages one at a time until cancelled."""
+        while True:
+            message = await self._chat_queue.get()
+            try:
+                await self._process_chat(message)
+            except Exception as e:
+                # 單則訊息的 UI 錯誤不能結束 consumer，否則之後的訊息會永遠卡在 queue
+                logger.exception("Failed to process chat message")
+                self._current_message = None
+                self._pending_panels = []
+                self._add_error_message(str(e))
 
     async def _process_chat(self, message: str) -> None:
         """Process a chat message through the agent.
@@ -408,16 +473,23 @@ class ChatScreen(Screen):
         if not self._agent:
             return
 
-        container = self.query_one("#chat-container")
+        container = self._container
 
         # Show thinking indicator
         thinking = ThinkingIndicator()
         await container.mount(thinking)
-        self.call_after_refresh(container.scroll_end, animate=False)
+        self._schedule_scroll_end()
 
         # Track if we've received first response
         first_response = True
 
+        # 以 type() 查表分派非文字事件，避免逐一 isinstance
+        handlers = {
+            ToolStartEvent: self._handle_tool_start,
+            ToolEndEvent: self._handle_tool_end,
+            DoneEvent: self._handle_done,
+        }
+
         try:
             async for event in self._agent.chat(message):
                 # Remove thinking indicator on first response
@@ -427,45 +499,22 @@ class ChatScreen(Screen):
                     # Create assistant message container
                     self._current_message = self._add_assistant_message()
 
-                if isinstance(event, TextEvent):
-                    # Append text to current message
+                event_type = type(event)
+                if event_type is TextEvent:
+                    # MessageView 以 timer 合併 chunk 更新，串流停頓時也會顯示
                     if self._current_message:
                         self._current_message.append_text(event.text)
                         # Scroll to show new content
-                        self.call_after_refresh(container.scroll_end, animate=False)
-
-                elif isinstance(event, ToolStartEvent):
-                    # Add tool panel, track by tool_id
-                    tool_name = format_tool_name(event.tool_name)
-                    panel = ToolPanel(
-                        tool_name=tool_name,
-                        tool_input=event.tool_input,
-                    )
-                    self._tool_panels[event.tool_id] = panel
-                    await container.mount(panel)
-                    panel.refresh()  # Force refresh to ensure immediate rendering
-                    self.call_after_refresh(container.scroll_end, animate=False)
-                    # Wait for mount and initial render to complete
-                    await asyncio.sleep(0.1)
-
-                elif isinstance(event, ToolEndEvent):
-                    # Find panel by tool_id and update status
-                    panel = self._tool_panels.pop(event.tool_id, None)
-                    if panel:
-                        panel.set_result(event.result, event.is_error)
-                        # Remove panel on success, keep on error for visibility
-                        if not event.is_error:
-                            await asyncio.sleep(0.5)  # Delay to ensure user sees the result
-                            await panel.remove()
-
-                elif isinstance(event, DoneEvent):
-                    # Update status bar
-                    status_bar = self.query_one(StatusBar)
-                    status_bar.update_stats(
-                        event.cost_usd,
-                        event.input_tokens,
-                        event.output_tokens,
-                    )
+                        self._schedule_scroll_end()
+                    continue
+
+                # Panels must be mounted before their results are set
+                if event_type is not ToolStartEvent:
+                    await self._flush_tool_panels()
+
+                handler = handlers.get(event_type)
+                if handler is not None:
+                    await handler(event)
 
         except Exception as e:
             # Remove thinking indicator if still present
@@ -474,9 +523,108 @@ class ChatScreen(Screen):
             self._add_error_message(str(e))
 
         finally:
+            await self._flush_tool_panels()
+            # 串流結束後送出剩餘文字，之後不再更新這則訊息
+            if self._current_message:
+                self._current_message.freeze()
             self._current_message = None
             # Scroll to bottom
-            self.call_after_refresh(container.scroll_end, animate=False)
+            self._schedule_scroll_end()
+
+    async def _handle_tool_start(self, event: ToolStartEvent) -> None:
+        """Mount a tool panel for a started tool call.
+
+        Args:
+            event: The tool start event.
+        """
+        # Add tool panel, track by tool_id
+        panel = ToolPanel(
+            tool_name=format_tool_name(event.tool_name),
+            tool_input=event.tool_input,
+        )
+        self._tool_panels[event.tool_id] = panel
+        # 同一批連續的 tool 呼叫累積後一次 mount，call_later 會在
+        # worker 等待下一個事件時執行，確保長時間執行的工具仍即時顯示
+        if not self._pending_panels:
+            self.call_later(self._flush_tool_panels)
+        self._pending_panels.append(panel)
+
+    async def _flush_tool_panels(self) -> None:
+        """Mount all buffered tool panels in a single batch."""
+        if not self._pending_panels:
+            return
+        panels, self._pending_panels = self._pending_panels, []
+        await self._container.mount(*panels)
+        self._schedule_scroll_end()
+
+    async def _handle_tool_end(self, event: ToolEndEvent) -> None:
+        """Update the tool panel of a finished tool call.
+
+        Args:
+            event: The tool end event.
+        """
+        # Find panel by tool_id and update status
+        panel = self._tool_panels.pop(event.tool_id, None)
+        if panel:
+            panel.set_result(event.result, event.is_error)
+            # Remove panel on success, keep on error for visibility
+            # Delay removal so the user sees the result, without
+            # blocking the draining of later agent events
+            if not event.is_error:
+                self.set_timer(TOOL_PANEL_LINGER, panel.remove)
+
+    async def _handle_done(self, event: DoneEvent) -> None:
+        """Update the status bar with the turn's usage.
+
+        Args:
+            event: The done event.
+        """
+        self._status_bar.update_stats(
+            event.cost_usd,
+            event.input_tokens,
+            event.output_tokens,
+        )
+
+    def _schedule_scroll_end(self) -> None:
+        """Scroll the chat container to the end after the next refresh.
+
+        Multiple calls before the refresh are coalesced into one scroll.
+        """
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.call_after_refresh(self._do_scroll_end)
+
+    def _do_scroll_end(self) -> None:
+        """Perform the pending scroll-to-end."""
+        self._scroll_pending = False
+        if self._container is not None:
+            # 已在 refresh 之後，直接捲動；不加 immediate 會再延後一次 refresh
+            self._container.scroll_end(animate=False, immediate=True)
+
+    def _mount_message(self, role: RoleType, content: str, scroll: bool = True) -> MessageView:
+        """Mount a message view, reusing a pooled one when available.
+
+        Args:
+            role: Message role.
+            content: Message content.
+            scroll: Whether to scroll to the end after mounting.
+
+        Returns:
+            The MessageView now shown at the end of the chat.
+        """
+        container = self._container
+        if self._message_pool:
+            msg = self._message_pool.pop()
+            msg.reset(role, content)
+            msg.display = True
+            container.move_child(msg, after=container.children[-1])
+        else:
+            msg = MessageView(role=role, content=content)
+            container.mount(msg)
+        if scroll:
+            self._schedule_scroll_end()
+        return msg
 
     def _add_user_message(self, content: str) -> MessageView:
         """Add a user message to the chat.
@@ -487,11 +635,7 @@ class ChatScreen(Screen):
         Returns:
             The created MessageView widget.
         """
-        msg = MessageView(role="user", content=content)
-        container = self.query_one("#chat-container")
-        container.mount(msg)
-        self.call_after_refresh(container.scroll_end, animate=False)
-        return msg
+        return self._mount_message("user", content)
 
     def _add_assistant_message(self, content: str = "") -> MessageView:
         """Add an assistant message to the chat.
@@ -502,11 +646,7 @@ class ChatScreen(Screen):
         Returns:
             The created MessageView widget.
         """
-        msg = MessageView(role="assistant", content=content)
-        container = self.query_one("#chat-container")
-        container.mount(msg)
-        self.call_after_refresh(container.scroll_end, animate=False)
-        return msg
+        return self._mount_message("assistant", content)
 
     def _add_system_message(self, content: str) -> None:
         """Add a system message to the chat.
@@ -514,9 +654,7 @@ class ChatScreen(Screen):
         Args:
             content: Message content.
         """
-        msg = MessageView(role="system", content=content)
-        container = self.query_one("#chat-container")
-        container.mount(msg)
+        self._mount_message("system", content, scroll=False)
 
     def _add_error_message(self, content: str) -> None:
         """Add an error message to the chat.
@@ -524,26 +662,34 @@ class ChatScreen(Screen):
         Args:
             content: Error message content.
         """
-        msg = MessageView(role="error", content=f"Error: {content}")
-        container = self.query_one("#chat-container")
-        container.mount(msg)
-        self.call_after_refresh(container.scroll_end, animate=False)
+        self._mount_message("error", f"Error: {content}")
 
     def clear_messages(self) -> None:
         """Clear all messages from the chat."""
-        container = self.query_one("#chat-container")
-        container.remove_children()
+        container = self._container
+        # MessageView 隱藏後放回 pool（保留上限），其餘 widget 直接移除
+        for child in list(container.children):
+            if child is self._current_message:
+                # 串流中的訊息不能進 pool，否則下一則訊息會重用它，
+                # 後續串流文字就會寫進別的訊息；直接移除並停止寫入
+                child.remove()
+                self._current_message = None
+            elif isinstance(child, MessageView) and len(self._message_pool) < MESSAGE_POOL_SIZE:
+                child.display = False
+                self._message_pool.append(child)
+            else:
+                child.remove()
         self._add_system_message("Chat cleared. Type /help for commands.")
 
     def scroll_up(self) -> None:
         """Scroll chat container up."""
-        container = self.query_one("#chat-container")
+        container = self._container
         # Scroll by 5 lines instead of full page
         container.scroll_relative(y=-5, animate=False)
 
     def scroll_down(self) -> None:
         """Scroll chat container down."""
-        container = self.query_one("#chat-container")
+        container = self._container
         # Scroll by 5 lines instead of full page
         container.scroll_relative(y=5, animate=False)
 
@@ -562,10 +708,10 @@ class ChatScreen(Screen):
         self.plan_task = task
 
         # Update UI
-        chat_input = self.query_one("#chat-input", ChatInput)
+        chat_input = self._chat_input
         chat_input.add_class("plan-mode")
 
-        status_bar = self.query_one(StatusBar)
+        status_bar = self._status_bar
         status_bar.set_plan_mode(True, task)
 
         self._add_system_message(
@@ -575,11 +721,8 @@ class ChatScreen(Screen):
         )
 
         # Send initial planning message to agent
-        self.run_worker(
-            self._process_chat(
-                f"[Plan Mode] Task: {task}\n\nPlease create a detailed plan for this task. Do NOT make any changes yet - only provide a plan."
-            ),
-            exclusive=True,
+        self._chat_queue.put_nowait(
+            f"[Plan Mode] Task: {task}\n\nPlease create a detailed plan for this task. Do NOT make any changes yet - only provide a plan."
         )
 
     def exit_plan_mode(self, approved: bool = False) -> None:
@@ -593,20 +736,17 @@ class ChatScreen(Screen):
         self.plan_task = ""
 
         # Update UI
-        chat_input = self.query_one("#chat-input", ChatInput)
+        chat_input = self._chat_input
         chat_input.remove_class("plan-mode")
 
-        status_bar = self.query_one(StatusBar)
+        status_bar = self._status_bar
         status_bar.set_plan_mode(False)
 
         if approved:
             self._add_system_message("**Plan Approved** - Switching to Execute Mode.")
             # Send approval message to agent
-            self.run_worker(
-                self._process_chat(
-                    f"[Execute Mode] The plan for '{task}' has been approved. Please proceed with the implementation."
-                ),
-                exclusive=True,
+            self._chat_queue.put_nowait(
+                f"[Execute Mode] The plan for '{task}' has been approved. Please proceed with the implementation."
             )
         else:
             self._add_system_message("**Plan Rejected** - Exited Plan Mode.")
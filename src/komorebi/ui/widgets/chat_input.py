@@ -98,19 +98,24 @@ class ChatInput(TextArea):
             soft_wrap=True,
         )
         self.show_line_numbers = False
-        self._last_text = ""
+        # 只記錄 slash 狀態，避免保留或複製整個 buffer
+        self._in_slash_mode = False
 
     def on_text_area_changed(self, event) -> None:
         """Handle text changes to detect slash commands."""
-        text = self.text
+        doc = self.document
+        first_line = doc.get_line(0) if doc.line_count else ""
 
-        # Check if typing a slash command
-        if text.startswith("/") and "\n" not in text:
-            self.post_message(self.SlashTyped(text))
-        elif self._last_text.startswith("/") and not text.startswith("/"):
+        # Slash command: single line starting with /
+        is_slash = doc.line_count == 1 and first_line[:1] == "/"
+
+        # A change to a single-line document always changes its first line
+        if is_slash:
+            self.post_message(self.SlashTyped(first_line))
+        elif self._in_slash_mode:
             self.post_message(self.SlashCleared())
 
-        self._last_text = text
+        self._in_slash_mode = is_slash
 
     def on_key(self, event: events.Key) -> None:
         """Handle key events.
@@ -133,7 +138,10 @@ class ChatInput(TextArea):
                 # Notify parent to handle palette selection
                 self.post_message(self.EnterPressed())
             else:
-                # Normal submit
+                # Normal submit; skip materializing the buffer for an empty line
+                doc = self.document
+                if doc.line_count == 1 and not doc.get_line(0).strip():
+                    return
                 text = self.text.strip()
                 if text:
                     self.post_message(self.Submitted(text))
@@ -143,7 +151,7 @@ class ChatInput(TextArea):
     def clear(self) -> None:
         """Clear the input text."""
         self.text = ""
-        self._last_text = ""
+        self._in_slash_mode = False
 
     def set_text(self, text: str) -> None:
         """Set input text.
@@ -152,4 +160,4 @@ class ChatInput(TextArea):
             text: Text to set.
         """
         self.text = text
-        self._last_text = text
+        self._in_slash_mode = text[:1] == "/" and "\n" not in text
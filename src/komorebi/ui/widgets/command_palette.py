@@ -26,6 +26,10 @@ COMMANDS = [
     ("/exit", "Exit application"),
 ]
 
+# 預先計算小寫指令與顯示標籤 (cmd, cmd_lower, label)，避免每次按鍵重算
+# Format: "/command  Description"
+_COMMANDS_INDEX = [(cmd, cmd.lower(), f"{cmd:<12} [dim]{desc}[/dim]") for cmd, desc in COMMANDS]
+
 
 class CommandPalette(Vertical):
     """Command palette for slash command autocomplete.
@@ -82,6 +86,8 @@ class CommandPalette(Vertical):
         """Initialize command palette."""
         super().__init__()
         self._option_list: OptionList | None = None
+        # 上次篩選出的指令，結果相同時不重建 OptionList
+        self._last_filter_result: tuple[str, ...] | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the palette layout."""
@@ -100,6 +106,8 @@ class CommandPalette(Vertical):
         """
         self.filter_text = filter_text
         self.add_class("visible")
+        # Always rebuild (and re-highlight) when the palette is opened
+        self._last_filter_result = None
         self._update_options()
         # Don't focus OptionList - we handle keys manually
 
@@ -123,15 +131,17 @@ class CommandPalette(Vertical):
         if not self._option_list:
             return
 
-        self._option_list.clear_options()
+        # Filter commands based on input; every command starts with "/", so
+        # matching without the leading "/" is the only check needed
+        needle = self.filter_text.lower().removeprefix("/")
+        matches = [entry for entry in _COMMANDS_INDEX if needle in entry[1]]
+        matched_ids = tuple(cmd for cmd, _, _ in matches)
+        if matched_ids == self._last_filter_result:
+            return
+        self._last_filter_result = matched_ids
 
-        # Filter commands based on input
-        filter_lower = self.filter_text.lower()
-        for cmd, desc in COMMANDS:
-            if filter_lower in cmd.lower() or filter_lower.lstrip("/") in cmd.lower():
-                # Format: "/command  Description"
-                label = f"{cmd:<12} [dim]{desc}[/dim]"
-                self._option_list.add_option(Option(label, id=cmd))
+        # set_options 一次清空並加入，不像 clear_options + add_options 會多做一次 layout 更新
+        self._option_list.set_options(Option(label, id=cmd) for cmd, _, label in matches)
 
         # Highlight first option
         if self._option_list.option_count > 0:
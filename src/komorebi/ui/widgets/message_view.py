@@ -5,13 +5,37 @@ Displays chat messages with Markdown rendering.
 
 from typing import Literal
 
+from markdown_it import MarkdownIt
 from textual.app import ComposeResult
 from textual.containers import Vertical
+from textual.timer import Timer
 from textual.widgets import Markdown, Static
 
 
 RoleType = Literal["user", "assistant", "system", "error"]
 
+# 出現這些字元時才需要 Markdown 解析；換行也算，因為 Markdown 會合併單一換行
+_MD_CHARS = frozenset("`*_#[]~>|<\\\n")
+# 行首是這些字元時可能是清單
+_MD_LINE_STARTS = "-+0123456789"
+# 與 Textual Markdown widget 預設相同的 parser，用來找出已完成的頂層區塊
+_BLOCK_PARSER = MarkdownIt("gfm-like")
+
+
+def _is_plain(role: RoleType, content: str) -> bool:
+    """Return True if a message can be shown as plain text without Markdown.
+
+    Args:
+        role: Message role.
+        content: Message content.
+
+    Returns:
+        True for non-empty user messages without Markdown syntax.
+    """
+    if role != "user" or not content or content[0] in _MD_LINE_STARTS:
+        return False
+    return _MD_CHARS.isdisjoint(content)
+
 
 class MessageView(Vertical):
     """Message view widget.
@@ -53,12 +77,18 @@ class MessageView(Vertical):
         color: $error;
     }
 
-    MessageView Markdown {
+    MessageView Markdown, MessageView .frozen-content {
         padding: 0;
         margin: 0 0 1 2;
     }
+
+    MessageView Markdown.md-block {
+        margin: 0 0 0 2;
+    }
     """
 
+    FLUSH_INTERVAL = 0.05  # 串流更新最多每 50ms 一次
+
     ROLE_LABELS = {
         "user": "> You",
         "assistant": "> Komorebi",
@@ -80,22 +110,191 @@ class MessageView(Vertical):
         super().__init__(classes=role)
         self._role = role
         self._content = content
+        # _markdown 只渲染尚未完成的尾端區塊；已完成的區塊各自成為一個
+        # Markdown widget，之後不再重新解析
         self._markdown: Markdown | None = None
+        self._block_widgets: list[Markdown] = []
+        self._tail = content
+        # live Markdown widget 目前顯示的尾端內容，相同時不重新 update
+        self._rendered_tail = content
+        self._scan_pos = 0
+        self._label: Static | None = None
+        # 純文字的使用者訊息以 Static 顯示
+        self._frozen: Static | None = None
+        # 串流 chunk 暫存，由 timer 合併成一次 update
+        self._pending: list[str] = []
+        self._flush_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the message layout."""
         label = self.ROLE_LABELS.get(self._role, self._role)
-        yield Static(label, classes=f"role-label {self._role}")
-        self._markdown = Markdown(self._content)
-        yield self._markdown
+        self._label = Static(label, classes=f"role-label {self._role}")
+        yield self._label
+        if _is_plain(self._role, self._content):
+            self._frozen = Static(self._content, markup=False, classes="frozen-content")
+            yield self._frozen
+        else:
+            self._markdown = Markdown(self._tail)
+            self._rendered_tail = self._tail
+            yield self._markdown
 
     def append_text(self, text: str) -> None:
         """Append text to the message (for streaming).
 
+        Chunks arriving within FLUSH_INTERVAL are coalesced into a single
+        Markdown update.
+
+        Args:
+            text: Text to append.
+        """
+        self._pending.append(text)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(self.FLUSH_INTERVAL, self._flush_pending)
+
+    def _flush_pending(self) -> None:
+        """Apply all pending chunks in one update."""
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if not self._pending:
+            return
+
+        text = "".join(self._pending)
+        self._pending.clear()
+        self._apply_text(text)
+
+    def _apply_text(self, text: str) -> None:
+        """Render appended text.
+
+        Completed blocks are split off into their own Markdown widgets so
+        that each update only re-parses the trailing, still-growing block.
+
         Args:
             text: Text to append.
         """
         self._content += text
-        if self._markdown:
-            # Use update() for streaming - Textual v7 doesn't have append()
-            self._markdown.update(self._content)
+        self._tail += text
+        if self._markdown is None:
+            if self._frozen is None:
+                return
+            if _is_plain(self._role, self._content):
+                self._frozen.update(self._content)
+                return
+            # 出現 Markdown 語法時換回可串流的 Markdown widget
+            self._show_markdown()
+
+        for block in self._take_completed_blocks():
+            widget = Markdown(block, classes="md-block")
+            self._block_widgets.append(widget)
+            self.mount(widget, before=self._markdown)
+        # Use update() for streaming - Textual v7 doesn't have append()
+        if self._tail != self._rendered_tail:
+            self._markdown.update(self._tail)
+            self._rendered_tail = self._tail
+
+    def _take_completed_blocks(self) -> list[str]:
+        """Split completed top-level blocks off the front of the tail buffer.
+
+        The complete lines of the tail are parsed with the same markdown-it
+        preset as Textual's Markdown widget. Every top-level block but the
+        last is complete, since the next one has already started, so lists,
+        block quotes, indented code and fences that span blank lines are
+        never cut apart. Parsing only runs once a new line has completed.
+
+        Returns:
+            Completed block texts, in order.
+        """
+        tail = self._tail
+        end = tail.rfind("\n") + 1
+        if end <= self._scan_pos:
+            return []
+        self._scan_pos = end
+
+        # 各行在 tail 中的起始位置；markdown-it 的 map 以 "\n" 分行計算
+        line_starts = [0]
+        pos = tail.find("\n")
+        while pos != -1 and pos < end:
+            line_starts.append(pos + 1)
+            pos = tail.find("\n", pos + 1)
+        block_lines = [
+            token.map[0]
+            for token in _BLOCK_PARSER.parse(tail[:end])
+            if token.level == 0 and token.map
+        ]
+        if len(block_lines) < 2:
+            return []
+
+        # 第一個區塊從 0 開始，連同前面沒有 token 的行（例如連結定義）
+        bounds = [line_starts[line] for line in [0, *block_lines[1:]]]
+        blocks = [
+            block
+            for start, stop in zip(bounds, bounds[1:])
+            if (block := tail[start:stop].strip("\n"))
+        ]
+        self._tail = tail[bounds[-1] :]
+        self._scan_pos = end - bounds[-1]
+        return blocks
+
+    def _reset_blocks(self) -> None:
+        """Drop split-off block widgets and reset the streaming state."""
+        for widget in self._block_widgets:
+            widget.remove()
+        self._block_widgets = []
+        self._tail = self._content
+        self._scan_pos = 0
+
+    def freeze(self) -> None:
+        """Render any pending text and stop streaming updates.
+
+        Called once streaming has finished. The Textual Markdown widgets stay
+        in place, so the finished message keeps the look it had while
+        streaming; they only re-parse when updated, so an idle message costs
+        nothing more.
+        """
+        self._flush_pending()
+
+    def reset(self, role: RoleType, content: str = "") -> None:
+        """Reuse this (already mounted) view for a new message.
+
+        Args:
+            role: New message role.
+            content: New message content.
+        """
+        self.remove_class(self._role)
+        self.add_class(role)
+        self._role = role
+        self._content = content
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        self._pending.clear()
+        self._reset_blocks()
+        if self._label is not None:
+            self._label.update(self.ROLE_LABELS.get(role, role))
+            self._label.set_classes(f"role-label {role}")
+
+        if _is_plain(role, content):
+            if self._frozen is not None:
+                self._frozen.update(content)
+            elif self._markdown is not None:
+                self._frozen = Static(content, markup=False, classes="frozen-content")
+                self.mount(self._frozen, after=self._markdown)
+                self._markdown.remove()
+                self._markdown = None
+        elif self._markdown is not None:
+            self._markdown.update(content)
+            self._rendered_tail = content
+        else:
+            self._show_markdown()
+
+    def _show_markdown(self) -> None:
+        """Swap the Static content widget back to a live Markdown widget."""
+        self._reset_blocks()
+        self._markdown = Markdown(self._tail)
+        self._rendered_tail = self._tail
+        if self._frozen is not None:
+            self.mount(self._markdown, after=self._frozen)
+            self._frozen.remove()
+            self._frozen = None
+        else:
+            self.mount(self._markdown)
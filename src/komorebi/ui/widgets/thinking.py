@@ -3,6 +3,8 @@
 Shows an animated indicator while waiting for AI response.
 """
 
+from itertools import product
+
 from textual.widgets import Static
 from textual.reactive import reactive
 
@@ -30,6 +32,8 @@ class ThinkingIndicator(Static):
         "Analyzing...",
         "Pondering...",
     ]
+    # 預先組好所有 frame × message 字串，索引為 frame * len(MESSAGES) + message
+    _RENDER = tuple(f"{frame} {message}" for frame, message in product(FRAMES, MESSAGES))
 
     frame_index: reactive[int] = reactive(0)
 
@@ -60,6 +64,4 @@ class ThinkingIndicator(Static):
 
     def _update_display(self) -> None:
         """Update the display text."""
-        frame = self.FRAMES[self.frame_index]
-        message = self.MESSAGES[self._message_index]
-        self.update(f"{frame} {message}")
+        self.update(self._RENDER[self.frame_index * len(self.MESSAGES) + self._message_index])
@@ -79,11 +79,30 @@ class ToolPanel(Collapsible):
 
         self._tool_name = tool_name
         self._tool_input = tool_input or {}
+        self._input_text = self._format_input(self._tool_input)
         self._result: str | None = None
         self._is_error: bool = False
         self._result_widget: Static | None = None
         self._status_widget: Static | None = None
 
+    @staticmethod
+    def _format_input(tool_input: dict[str, Any]) -> str:
+        """Format tool input parameters, truncating long values.
+
+        Args:
+            tool_input: Tool input parameters.
+
+        Returns:
+            One "key: value" line per parameter.
+        """
+        input_lines = []
+        for key, value in tool_input.items():
+            value_str = str(value)
+            if len(value_str) > 60:
+                value_str = value_str[:60] + "..."
+            input_lines.append(f"  {key}: {value_str}")
+        return "\n".join(input_lines)
+
     def compose(self) -> ComposeResult:
         """Compose the panel content."""
         # Show static running status
@@ -91,14 +110,8 @@ class ToolPanel(Collapsible):
         yield self._status_widget
 
         # Show input parameters
-        if self._tool_input:
-            input_lines = []
-            for key, value in self._tool_input.items():
-                value_str = str(value)[:60]
-                if len(str(value)) > 60:
-                    value_str += "..."
-                input_lines.append(f"  {key}: {value_str}")
-            yield Static("\n".join(input_lines), classes="tool-input")
+        if self._input_text:
+            yield Static(self._input_text, classes="tool-input")
 
         # Placeholder for result
         self._result_widget = Static("", classes="tool-result")
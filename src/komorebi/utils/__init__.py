@@ -1,21 +1,62 @@
 """Komorebi utilities."""
 
-from .git import get_commits_in_range, get_today_commits, run_git_command
-from .markdown import (
-    get_section_content,
-    load_frontmatter,
-    read_file_safely,
-    save_frontmatter,
-    update_section,
+from typing import TYPE_CHECKING, Any
+
+from .git import (
+    get_commits_in_range,
+    get_today_commits,
+    get_today_commits_multi,
+    run_git_command,
+    run_git_command_lines,
+)
+
+if TYPE_CHECKING:
+    from .markdown import (
+        get_section_content,
+        load_frontmatter,
+        load_frontmatter_readonly,
+        read_file_safely,
+        save_frontmatter,
+        update_section,
+        write_file_atomic,
+    )
+
+# markdown 模組會載入 frontmatter / PyYAML，延後到第一次使用時才 import
+_MARKDOWN_EXPORTS = frozenset(
+    {
+        "load_frontmatter",
+        "load_frontmatter_readonly",
+        "save_frontmatter",
+        "read_file_safely",
+        "update_section",
+        "get_section_content",
+        "write_file_atomic",
+    }
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve markdown utilities (PEP 562)."""
+    if name in _MARKDOWN_EXPORTS:
+        from . import markdown
+
+        value = getattr(markdown, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "run_git_command",
+    "run_git_command_lines",
     "get_commits_in_range",
     "get_today_commits",
+    "get_today_commits_multi",
     "load_frontmatter",
+    "load_frontmatter_readonly",
     "save_frontmatter",
     "read_file_safely",
     "update_section",
     "get_section_content",
+    "write_file_atomic",
 ]
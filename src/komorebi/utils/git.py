@@ -5,15 +5,26 @@
 
 import asyncio
 import logging
-from datetime import datetime
+from collections.abc import AsyncIterator
+from datetime import date, datetime
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# run_git_command 最多讀取的輸出量，避免意外的大量輸出佔滿記憶體
+_MAX_OUTPUT_BYTES = 4 << 20
+_READ_CHUNK = 1 << 16
+# run_git_command_lines 單行上限（asyncio 預設 64 KiB，過長的 commit message 會超過）
+_MAX_LINE_BYTES = 1 << 20
+
+
 async def run_git_command(repo_path: Path, args: list[str], timeout: int = 30) -> str:
     """Run a git command asynchronously and return output.
 
+    Output beyond _MAX_OUTPUT_BYTES is not read; the process is killed and
+    the output is cut at the last complete line.
+
     Args:
         repo_path: Path to the git repository.
         args: Git command arguments.
@@ -30,16 +41,96 @@ async def run_git_command(repo_path: Path, args: list[str], timeout: int = 30) -
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.DEVNULL,
         )
-        stdout, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except FileNotFoundError:
+        logger.warning("Git executable not found")
+        return ""
+    except OSError as e:
+        logger.warning(f"Git command failed: {e}")
+        return ""
+
+    assert process.stdout is not None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    chunks: list[bytes] = []
+    total = 0
+    try:
+        while total <= _MAX_OUTPUT_BYTES:
+            chunk = await asyncio.wait_for(process.stdout.read(_READ_CHUNK), deadline - loop.time())
+            if not chunk:
+                break
+            chunks.append(chunk)
+            total += len(chunk)
+        else:
+            logger.warning(f"Git output truncated: git {' '.join(args)}")
+            data = b"".join(chunks)[:_MAX_OUTPUT_BYTES]
+            return data[: data.rfind(b"\n") + 1].decode("utf-8", "replace").strip()
+        await asyncio.wait_for(process.wait(), deadline - loop.time())
         if process.returncode == 0:
-            return stdout.decode().strip()
-    except asyncio.TimeoutError:
+            return b"".join(chunks).decode().strip()
+        logger.warning(f"Git command exited with {process.returncode}: git {' '.join(args)}")
+    except TimeoutError:
         logger.warning(f"Git command timed out: git {' '.join(args)}")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return ""
+
+
+async def run_git_command_lines(
+    repo_path: Path, args: list[str], timeout: int = 30
+) -> AsyncIterator[str]:
+    """Run a git command asynchronously and yield its output line by line.
+
+    與 run_git_command 不同，輸出逐行解碼，不先組成完整字串再切割；
+    呼叫端可以提早 break（process 會被終止）。
+
+    Args:
+        repo_path: Path to the git repository.
+        args: Git command arguments.
+        timeout: Overall command timeout in seconds.
+
+    Yields:
+        Non-empty output lines, decoded as UTF-8. A non-zero exit status or
+        an output line over _MAX_LINE_BYTES is logged and ends the output.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            limit=_MAX_LINE_BYTES,
+        )
     except FileNotFoundError:
         logger.warning("Git executable not found")
+        return
     except OSError as e:
         logger.warning(f"Git command failed: {e}")
-    return ""
+        return
+
+    assert process.stdout is not None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while raw := await asyncio.wait_for(process.stdout.readline(), deadline - loop.time()):
+            line = raw.rstrip(b"\r\n").decode("utf-8", "replace")
+            if line:
+                yield line
+        await asyncio.wait_for(process.wait(), deadline - loop.time())
+        if process.returncode != 0:
+            # bad ref、不是 repo 等錯誤不要被當成「沒有輸出」
+            logger.warning(f"Git command exited with {process.returncode}: git {' '.join(args)}")
+    except ValueError:
+        # StreamReader.readline 在單行超過 limit 時丟出 ValueError
+        logger.warning(f"Git output line too long: git {' '.join(args)}")
+    except TimeoutError:
+        logger.warning(f"Git command timed out: git {' '.join(args)}")
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
 
 
 async def get_commits_in_range(
@@ -56,29 +147,81 @@ async def get_commits_in_range(
 
     Returns:
         List of commit lines (hash + message).
+
+    Note:
+        One ``git log`` process per repository covers the whole range.
     """
-    start_str = start_date.strftime("%Y-%m-%d")
-    end_str = end_date.strftime("%Y-%m-%d")
+    # 帶上時間：只給日期時 git 會把它當成「該日的現在時刻」，--until 會漏掉當天稍晚的 commits
+    start_str = start_date.strftime("%Y-%m-%d %H:%M:%S")
+    end_str = end_date.strftime("%Y-%m-%d %H:%M:%S")
+
+    return [
+        line
+        async for line in run_git_command_lines(
+            repo_path,
+            ["log", f"--since={start_str}", f"--until={end_str}", "--oneline"],
+        )
+    ]
 
-    log = await run_git_command(
-        repo_path,
-        ["log", f"--since={start_str}", f"--until={end_str}", "--oneline"],
-    )
 
-    return log.split("\n") if log else []
+# (repo_path, HEAD sha, 日期) -> 今日 commits；HEAD 沒動時結果不會變
+_COMMITS_CACHE: dict[tuple[Path, str, str], list[str]] = {}
 
 
 async def get_today_commits(repo_path: Path) -> list[str]:
     """Get today's git commits from a repository.
 
+    Results are cached by HEAD sha and date, so repeated calls only run a
+    cheap ``git rev-parse HEAD`` until a new commit lands.
+
     Args:
         repo_path: Path to the git repository.
 
     Returns:
         List of commit messages (short format).
     """
-    log = await run_git_command(
-        repo_path,
-        ["log", "--since=00:00", "--format=%s (%h)", "--no-merges"],
-    )
-    return log.split("\n") if log else []
+    head = await run_git_command(repo_path, ["rev-parse", "HEAD"])
+    today = date.today().isoformat()
+    key = (repo_path, head, today)
+    if head and key in _COMMITS_CACHE:
+        return list(_COMMITS_CACHE[key])
+
+    commits = [
+        line
+        async for line in run_git_command_lines(
+            repo_path,
+            ["log", "--since=00:00", "--format=%s (%h)", "--no-merges"],
+        )
+    ]
+    if head:
+        # 每個 repo 只保留今天最新 HEAD 的結果
+        for stale in [k for k in _COMMITS_CACHE if k[0] == repo_path or k[2] != today]:
+            del _COMMITS_CACHE[stale]
+        _COMMITS_CACHE[key] = commits
+    return list(commits)
+
+
+# 同時執行的 git process 上限，避免專案很多時一次 fork 太多
+_MAX_CONCURRENT_GIT = 8
+
+
+async def get_today_commits_multi(repo_paths: list[Path]) -> dict[Path, list[str]]:
+    """Get today's git commits from several repositories concurrently.
+
+    Args:
+        repo_paths: Paths to the git repositories.
+
+    Returns:
+        Mapping of repository path to its commit messages (empty on error).
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_GIT)
+
+    async def _bounded(repo_path: Path) -> list[str]:
+        async with semaphore:
+            return await get_today_commits(repo_path)
+
+    results = await asyncio.gather(*(_bounded(p) for p in repo_paths), return_exceptions=True)
+    return {
+        path: [] if isinstance(result, BaseException) else result
+        for path, result in zip(repo_paths, results)
+    }
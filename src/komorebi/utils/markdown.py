@@ -3,14 +3,58 @@
 提取重複的 frontmatter 操作到共用模組。
 """
 
+import codecs
+import copy
+import os
+import shutil
+import threading
 from pathlib import Path
+from typing import Any
 
 import frontmatter
 
+# 以 (mtime_ns, size) 驗證的讀檔快取，檔案未變更時只需一次 stat
+_CACHE_SIZE = 128
+_frontmatter_cache: dict[Path, tuple[int, int, frontmatter.Post]] = {}
+_text_cache: dict[tuple[Path, int], tuple[int, int, str]] = {}
+# 這些函式會在 asyncio.to_thread 的 worker 中呼叫；寫入與淘汰需持有鎖，
+# 單純的 dict.get 在 GIL 下是 atomic，不需要鎖
+_cache_lock = threading.Lock()
+
+
+def _remember(cache: dict[Any, Any], key: Any, value: Any) -> None:
+    """Store a cache entry, evicting the oldest one when full."""
+    with _cache_lock:
+        if key not in cache and len(cache) >= _CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _invalidate(file_path: Path) -> None:
+    """Drop cached entries for a file that is being rewritten."""
+    with _cache_lock:
+        _frontmatter_cache.pop(file_path, None)
+        for key in [key for key in _text_cache if key[0] == file_path]:
+            del _text_cache[key]
+
+
+def _load_cached_post(file_path: Path) -> frontmatter.Post:
+    """Parse a frontmatter file, reusing the cached Post while it is unchanged."""
+    st = file_path.stat()
+    cached = _frontmatter_cache.get(file_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    post = frontmatter.load(file_path)
+    _remember(_frontmatter_cache, file_path, (st.st_mtime_ns, st.st_size, post))
+    return post
+
 
 def load_frontmatter(file_path: Path) -> frontmatter.Post:
     """Load a markdown file with frontmatter.
 
+    Parsed results are cached by (path, mtime, size); each call returns its
+    own copy, so callers may modify and save it.
+
     Args:
         file_path: Path to the markdown file.
 
@@ -21,7 +65,29 @@ def load_frontmatter(file_path: Path) -> frontmatter.Post:
         FileNotFoundError: If file doesn't exist.
         ValueError: If frontmatter is invalid.
     """
-    return frontmatter.load(file_path)
+    post = _load_cached_post(file_path)
+    result = frontmatter.Post(post.content, handler=post.handler)
+    result.metadata = copy.deepcopy(post.metadata)
+    return result
+
+
+def load_frontmatter_readonly(file_path: Path) -> frontmatter.Post:
+    """Load a markdown file with frontmatter without copying the cached result.
+
+    與 load_frontmatter 共用同一份快取，但直接回傳快取中的 Post：
+    只能讀取，不可修改。需要修改並寫回時請使用 load_frontmatter。
+
+    Args:
+        file_path: Path to the markdown file.
+
+    Returns:
+        Shared, cached frontmatter.Post object.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        ValueError: If frontmatter is invalid.
+    """
+    return _load_cached_post(file_path)
 
 
 def save_frontmatter(file_path: Path, post: frontmatter.Post) -> None:
@@ -31,12 +97,42 @@ def save_frontmatter(file_path: Path, post: frontmatter.Post) -> None:
         file_path: Path to the markdown file.
         post: frontmatter.Post object to save.
     """
-    file_path.write_text(frontmatter.dumps(post), encoding="utf-8")
+    write_file_atomic(file_path, frontmatter.dumps(post).encode("utf-8"))
+
+
+def write_file_atomic(file_path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically.
+
+    先寫入同目錄的暫存檔再 os.replace，寫到一半失敗時不會留下殘缺的檔案。
+    暫存檔名包含 process 與 thread id，同時寫入同一個檔案時不會互相覆蓋暫存檔。
+    Symlink 會寫入其指向的檔案，既有檔案的權限也會保留。
+
+    Args:
+        file_path: Destination file path.
+        data: Encoded file content.
+    """
+    # 取代 symlink 指向的檔案，而不是把 symlink 換成一般檔案
+    target = file_path.resolve()
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    _invalidate(file_path)
+    if target != file_path:
+        _invalidate(target)
+    try:
+        tmp_path.write_bytes(data)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def read_file_safely(file_path: Path, max_chars: int = 4000) -> str:
     """Read file content with size limit.
 
+    Only the first ``max_chars * 4 + 4`` bytes are read, so large files are
+    not loaded in full.
+
     Args:
         file_path: Path to file.
         max_chars: Maximum characters to read.
@@ -44,15 +140,32 @@ def read_file_safely(file_path: Path, max_chars: int = 4000) -> str:
     Returns:
         File content (truncated if needed) or empty string.
     """
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except OSError:
         return ""
+    cache_key = (file_path, max_chars)
+    cached = _text_cache.get(cache_key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    # UTF-8 每個字元最多 4 bytes，只讀取足以判斷是否需要截斷的量
+    limit = max_chars * 4 + 4
     try:
-        content = file_path.read_text(encoding="utf-8")
-        if len(content) > max_chars:
-            return content[:max_chars] + "\n...(truncated)"
-        return content
+        with open(file_path, "rb") as f:
+            data = f.read(limit)
+        # 讀到上限時尾端可能切在多 byte 字元中間，保留不完整的部分不解碼
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        content = decoder.decode(data, final=len(data) < limit)
     except Exception:
         return ""
+    if "\r" in content:
+        # 與 read_text 的 universal newlines 一致
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    if len(content) > max_chars:
+        content = content[:max_chars] + "\n...(truncated)"
+    _remember(_text_cache, cache_key, (st.st_mtime_ns, st.st_size, content))
+    return content
 
 
 def update_section(
@@ -0,0 +1,29 @@
+"""Shared pytest fixtures."""
+
+from datetime import datetime, tzinfo
+
+import pytest
+
+# 測試中「今天」固定為這個時間點，避免跨午夜時結果不一致
+FROZEN_NOW = datetime(2026, 1, 15, 10, 0, 0)
+
+
+class FrozenDateTime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> "FrozenDateTime":
+        frozen = cls.combine(FROZEN_NOW.date(), FROZEN_NOW.time())
+        return frozen if tz is None else frozen.astimezone(tz)
+
+
+@pytest.fixture(scope="session")
+def frozen_today() -> str:
+    """Today's date string under FrozenDateTime."""
+    return FROZEN_NOW.strftime("%Y-%m-%d")
+
+
+@pytest.fixture(scope="session")
+def frozen_datetime() -> type[datetime]:
+    """datetime replacement to monkeypatch into modules under test."""
+    return FrozenDateTime
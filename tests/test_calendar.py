@@ -1,14 +1,37 @@
 """Tests for calendar tools."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-from komorebi.tools import calendar
+
+class _Response:
+    """Minimal HTTP response for constructing HttpError."""
+
+    status = 403
+    reason = "Forbidden"
+
+
+@pytest.fixture(scope="module")
+def calendar():
+    """Import the calendar tools on first use.
+
+    延後到測試實際執行時才載入 Google API client，
+    用 -k 排除 calendar 測試或只 collect 時不必付出 import 成本。
+    """
+    from komorebi.tools import calendar as calendar_module
+
+    return calendar_module
+
+
+@pytest.fixture(scope="module")
+def forbidden():
+    """A 403 HttpError, built once and reused."""
+    from googleapiclient.errors import HttpError
+
+    return HttpError(resp=_Response(), content=b"Forbidden")
 
 
 @pytest.fixture(autouse=True)
-def setup_config():
+def setup_config(calendar):
     """Set up calendar config for all tests."""
     calendar.set_config(
         {
@@ -19,7 +42,7 @@ def setup_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_events():
     """Sample calendar events."""
     return {
@@ -38,88 +61,132 @@ def mock_events():
     }
 
 
-@pytest.fixture
-def mock_service(mock_events):
-    """Create mock Calendar API service."""
-    service = MagicMock()
-    service.events().list().execute.return_value = mock_events
-    service.events().insert().execute.return_value = {
+class FakeCalendarService:
+    """Minimal stand-in for the Calendar API service.
+
+    Supports ``service.events().list(...).execute()`` and
+    ``service.events().insert(...).execute()``, recording the call kwargs.
+    """
+
+    __slots__ = ("_mode", "insert_calls", "insert_result", "list_calls", "list_result")
+
+    def __init__(self) -> None:
+        self.list_result: dict = {}
+        self.insert_result: dict = {}
+        self.list_calls: list[dict] = []
+        self.insert_calls: list[dict] = []
+        self._mode = ""
+
+    def events(self) -> "FakeCalendarService":
+        return self
+
+    def list(self, **kwargs) -> "FakeCalendarService":
+        self.list_calls.append(kwargs)
+        self._mode = "list"
+        return self
+
+    def insert(self, **kwargs) -> "FakeCalendarService":
+        self.insert_calls.append(kwargs)
+        self._mode = "insert"
+        return self
+
+    def execute(self) -> dict:
+        return self.list_result if self._mode == "list" else self.insert_result
+
+
+@pytest.fixture(scope="module")
+def mock_service():
+    """Create fake Calendar API service, shared across the module."""
+    return FakeCalendarService()
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_service(mock_service, mock_events):
+    """Reset recorded calls and results of the shared fake service."""
+    mock_service.list_calls.clear()
+    mock_service.insert_calls.clear()
+    mock_service.list_result = mock_events
+    mock_service.insert_result = {
         "summary": "Test Event",
         "htmlLink": "https://calendar.google.com/event/123",
     }
-    return service
 
 
-class TestListEvents:
-    """Tests for list_events tool."""
+@pytest.fixture
+def patched_service(monkeypatch, calendar, mock_service):
+    """Make _get_calendar_service return the shared fake service."""
+    monkeypatch.setattr(calendar, "_get_calendar_service", lambda: mock_service)
+    return mock_service
 
-    @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_returns_events(self, mock_get_service, mock_service):
-        """Should return formatted event list."""
-        mock_get_service.return_value = mock_service
 
-        result = await calendar.list_events.handler({"date": "2026-01-15"})
+def _raising(exc: Exception):
+    """Build a _get_calendar_service replacement that raises exc."""
 
-        assert result.get("is_error") is not True
-        text = result["content"][0]["text"]
-        assert "Team Standup" in text
-        assert "1:1 with Manager" in text
-        assert "09:00-10:00" in text
-        assert "Total: 2 event(s)" in text
+    def _get_calendar_service():
+        raise exc
+
+    return _get_calendar_service
+
+
+class TestListEvents:
+    """Tests for list_events tool."""
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_no_events(self, mock_get_service, mock_service):
-        """Should handle no events gracefully."""
-        mock_service.events().list().execute.return_value = {"items": []}
-        mock_get_service.return_value = mock_service
+    @pytest.mark.parametrize(
+        ("list_result", "want_texts"),
+        [
+            # None 表示使用 mock_events 的預設兩個事件
+            (
+                None,
+                ["Team Standup", "1:1 with Manager", "09:00-10:00", "Total: 2 event(s)"],
+            ),
+            ({"items": []}, ["No events"]),
+            (
+                {
+                    "items": [
+                        {
+                            "summary": "Holiday",
+                            "start": {"date": "2026-01-15"},
+                            "end": {"date": "2026-01-16"},
+                        }
+                    ]
+                },
+                ["all day", "Holiday"],
+            ),
+        ],
+        ids=["returns_events", "no_events", "all_day_event"],
+    )
+    async def test_list_events_formats_results(
+        self, calendar, patched_service, list_result, want_texts
+    ):
+        """Should format the events returned by the API."""
+        if list_result is not None:
+            patched_service.list_result = list_result
 
         result = await calendar.list_events.handler({"date": "2026-01-15"})
 
         assert result.get("is_error") is not True
-        assert "No events" in result["content"][0]["text"]
+        text = result["content"][0]["text"]
+        for want in want_texts:
+            assert want in text
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_uses_default_date(self, mock_get_service, mock_service):
+    async def test_list_events_uses_default_date(
+        self, calendar, patched_service, monkeypatch, frozen_datetime, frozen_today
+    ):
         """Should default to today if no date provided."""
-        mock_get_service.return_value = mock_service
+        monkeypatch.setattr(calendar, "datetime", frozen_datetime)
 
         result = await calendar.list_events.handler({})
 
         assert result.get("is_error") is not True
-        # Should call list() with some date
-        mock_service.events().list.assert_called()
+        # Should call list() with today's date
+        assert patched_service.list_calls[0]["timeMin"] == f"{frozen_today}T00:00:00Z"
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_handles_all_day_event(self, mock_get_service, mock_service):
-        """Should format all-day events correctly."""
-        mock_service.events().list().execute.return_value = {
-            "items": [
-                {
-                    "summary": "Holiday",
-                    "start": {"date": "2026-01-15"},
-                    "end": {"date": "2026-01-16"},
-                }
-            ]
-        }
-        mock_get_service.return_value = mock_service
-
-        result = await calendar.list_events.handler({"date": "2026-01-15"})
-
-        text = result["content"][0]["text"]
-        assert "all day" in text
-        assert "Holiday" in text
-
-    @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_handles_api_error(self, mock_get_service):
+    async def test_list_events_handles_api_error(self, calendar, monkeypatch, forbidden):
         """Should return error on API failure."""
-        from googleapiclient.errors import HttpError
-
-        mock_get_service.side_effect = HttpError(resp=MagicMock(status=403), content=b"Forbidden")
+        monkeypatch.setattr(calendar, "_get_calendar_service", _raising(forbidden))
 
         result = await calendar.list_events.handler({})
 
@@ -127,10 +194,11 @@ class TestListEvents:
         assert "API error" in result["content"][0]["text"]
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_list_events_handles_missing_credentials(self, mock_get_service):
+    async def test_list_events_handles_missing_credentials(self, calendar, monkeypatch):
         """Should return error if credentials not found."""
-        mock_get_service.side_effect = FileNotFoundError("credentials not found")
+        monkeypatch.setattr(
+            calendar, "_get_calendar_service", _raising(FileNotFoundError("credentials not found"))
+        )
 
         result = await calendar.list_events.handler({})
 
@@ -142,83 +210,53 @@ class TestAddEvent:
     """Tests for add_event tool."""
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_add_event_creates_timed_event(self, mock_get_service, mock_service):
-        """Should create a timed event."""
-        mock_get_service.return_value = mock_service
-
-        result = await calendar.add_event.handler(
-            {
-                "summary": "Code Review",
-                "start_time": "14:00",
-                "end_time": "15:00",
-                "date": "2026-01-15",
-            }
-        )
-
-        assert result.get("is_error") is not True
-        text = result["content"][0]["text"]
-        assert "Event Created" in text
-        assert "Code Review" in text
-
-    @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_add_event_creates_all_day_event(self, mock_get_service, mock_service):
-        """Should create an all-day event."""
-        mock_get_service.return_value = mock_service
-
-        result = await calendar.add_event.handler(
-            {
-                "summary": "Day Off",
-                "start_time": "all_day",
-                "date": "2026-01-15",
-            }
-        )
-
-        assert result.get("is_error") is not True
-        assert "Event Created" in result["content"][0]["text"]
-
-    @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_add_event_defaults_duration(self, mock_get_service, mock_service):
-        """Should default to 1 hour if end_time not provided."""
-        mock_get_service.return_value = mock_service
-
-        result = await calendar.add_event.handler(
-            {
-                "summary": "Quick Meeting",
-                "start_time": "10:00",
-                "date": "2026-01-15",
-            }
-        )
-
-        assert result.get("is_error") is not True
-        # Verify insert was called
-        mock_service.events().insert.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_add_event_requires_summary(self):
-        """Should error if summary not provided."""
-        result = await calendar.add_event.handler({"start_time": "10:00", "date": "2026-01-15"})
-
-        assert result.get("is_error") is True
-        assert "summary" in result["content"][0]["text"].lower()
-
-    @pytest.mark.asyncio
-    async def test_add_event_requires_start_time(self):
-        """Should error if start_time not provided."""
-        result = await calendar.add_event.handler({"summary": "Test Event", "date": "2026-01-15"})
+    @pytest.mark.parametrize(
+        ("args", "want_error", "want_text"),
+        [
+            (
+                {
+                    "summary": "Code Review",
+                    "start_time": "14:00",
+                    "end_time": "15:00",
+                    "date": "2026-01-15",
+                },
+                False,
+                "Code Review",
+            ),
+            (
+                {"summary": "Day Off", "start_time": "all_day", "date": "2026-01-15"},
+                False,
+                "Event Created",
+            ),
+            (
+                {"summary": "Quick Meeting", "start_time": "10:00", "date": "2026-01-15"},
+                False,
+                "Event Created",
+            ),
+            ({"start_time": "10:00", "date": "2026-01-15"}, True, "summary"),
+            ({"summary": "Test Event", "date": "2026-01-15"}, True, "start time"),
+        ],
+        ids=[
+            "timed_event",
+            "all_day_event",
+            "default_duration",
+            "requires_summary",
+            "requires_start_time",
+        ],
+    )
+    async def test_add_event(self, calendar, patched_service, args, want_error, want_text):
+        """Should create events, or reject input missing required fields."""
+        result = await calendar.add_event.handler(args)
 
-        assert result.get("is_error") is True
-        assert "start time" in result["content"][0]["text"].lower()
+        assert (result.get("is_error") is True) is want_error
+        assert want_text.lower() in result["content"][0]["text"].lower()
+        # 只有成功時才會呼叫 insert
+        assert bool(patched_service.insert_calls) is not want_error
 
     @pytest.mark.asyncio
-    @patch("komorebi.tools.calendar._get_calendar_service")
-    async def test_add_event_handles_api_error(self, mock_get_service):
+    async def test_add_event_handles_api_error(self, calendar, monkeypatch, forbidden):
         """Should return error on API failure."""
-        from googleapiclient.errors import HttpError
-
-        mock_get_service.side_effect = HttpError(resp=MagicMock(status=403), content=b"Forbidden")
+        monkeypatch.setattr(calendar, "_get_calendar_service", _raising(forbidden))
 
         result = await calendar.add_event.handler({"summary": "Test", "start_time": "10:00"})
 
@@ -228,7 +266,7 @@ class TestAddEvent:
 class TestFormatEvent:
     """Tests for _format_event helper."""
 
-    def test_format_timed_event(self):
+    def test_format_timed_event(self, calendar):
         """Should format timed event with times."""
         event = {
             "summary": "Meeting",
@@ -241,7 +279,7 @@ class TestFormatEvent:
         assert "09:00-10:00" in result
         assert "Meeting" in result
 
-    def test_format_all_day_event(self):
+    def test_format_all_day_event(self, calendar):
         """Should format all-day event."""
         event = {
             "summary": "Holiday",
@@ -254,7 +292,7 @@ class TestFormatEvent:
         assert "all day" in result
         assert "Holiday" in result
 
-    def test_format_event_no_title(self):
+    def test_format_event_no_title(self, calendar):
         """Should handle missing title."""
         event = {
             "start": {"dateTime": "2026-01-15T09:00:00+08:00"},
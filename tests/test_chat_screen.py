@@ -0,0 +1,294 @@
+"""Tests for the TUI chat screen.
+
+以假的 agent 取代 KomorebiAgent，透過 Textual 的 run_test 驅動 ChatScreen。
+"""
+
+import asyncio
+import importlib
+import sys
+import types
+from collections.abc import AsyncIterator
+from typing import Any, ClassVar, Self
+
+import pytest
+
+
+@pytest.fixture
+def chat(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    """Import the chat screen module.
+
+    komorebi.agent 匯入 komorebi.planner，但該模組不在 repo 中；
+    ChatScreen 測試以 FakeAgent 取代 agent，只需要 PlanManager 這個名稱存在。
+    """
+    try:
+        importlib.import_module("komorebi.planner")
+    except ModuleNotFoundError:
+        planner = types.ModuleType("komorebi.planner")
+        planner.PlanManager = object
+        monkeypatch.setitem(sys.modules, "komorebi.planner", planner)
+    return importlib.import_module("komorebi.ui.screens.chat")
+
+
+class FakeAgent:
+    """Agent stand-in that streams ``script``.
+
+    A ``None`` entry pauses the stream until ``release`` is set.
+    """
+
+    script: ClassVar[list[Any]] = []
+
+    def __init__(self, **kwargs) -> None:
+        self.release = asyncio.Event()
+        self.finished = 0
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def chat(self, message: str) -> AsyncIterator[Any]:
+        for event in self.script:
+            if event is None:
+                await self.release.wait()
+            else:
+                yield event
+        self.finished += 1
+
+
+@pytest.fixture
+def fake_agent(chat: types.ModuleType, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make ChatScreen create a FakeAgent that pauses mid-stream."""
+    monkeypatch.setattr(chat, "KomorebiAgent", FakeAgent)
+    monkeypatch.setattr(
+        FakeAgent,
+        "script",
+        [chat.TextEvent(text="first part "), None, chat.TextEvent(text="second part")],
+    )
+
+
+@pytest.fixture
+def app(chat: types.ModuleType, fake_agent: None) -> Any:
+    """Create the TUI app."""
+    from komorebi.ui.app import KomorebiApp
+
+    return KomorebiApp()
+
+
+async def _wait_for(pilot, condition) -> None:
+    """Let the app run until condition() is true."""
+    for _ in range(100):
+        if condition():
+            return
+        await pilot.pause(0.01)
+    pytest.fail("condition not reached")
+
+
+def _visible_messages(screen, chat: types.ModuleType) -> list[Any]:
+    return [
+        child
+        for child in screen._container.children
+        if isinstance(child, chat.MessageView) and child.display
+    ]
+
+
+def _finished(screen, count: int = 1) -> bool:
+    """Return True once the agent has streamed ``count`` replies and the UI caught up."""
+    return screen._agent.finished >= count and screen._current_message is None
+
+
+class TestClearMessages:
+    """Tests for /clear while a response is streaming."""
+
+    async def test_clear_during_stream_does_not_reuse_live_message(self, app, chat) -> None:
+        """Streamed text must not end up in the "Chat cleared" message."""
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._chat_queue.put_nowait("hello")
+            await _wait_for(pilot, lambda: screen._current_message is not None)
+
+            screen.clear_messages()
+            screen._agent.release.set()
+            await _wait_for(pilot, lambda: _finished(screen))
+            await pilot.pause(0.1)
+
+            messages = _visible_messages(screen, chat)
+            assert [m._role for m in messages] == ["system"]
+            assert "second part" not in messages[0]._content
+            assert messages[0]._content.startswith("Chat cleared.")
+
+    async def test_cleared_messages_are_reused(self, app, chat) -> None:
+        """Views hidden by /clear should back the next messages."""
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._add_user_message("one")
+            screen._add_user_message("two")
+            await pilot.pause()
+            pooled = [
+                child
+                for child in screen._container.children
+                if isinstance(child, chat.MessageView) and child._role == "user"
+            ]
+
+            screen.clear_messages()
+            reused = screen._add_user_message("three")
+            await pilot.pause()
+
+            assert reused in pooled
+            assert [m._content for m in _visible_messages(screen, chat)][-1] == "three"
+
+
+class TestStreaming:
+    """Tests for streamed text and tool panels."""
+
+    async def test_all_streamed_text_is_shown(self, app, chat) -> None:
+        """Every text chunk should reach the message once the stream ends."""
+        FakeAgent.script = [chat.TextEvent(text=f"{i} ") for i in range(50)]
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._chat_queue.put_nowait("hello")
+            await _wait_for(pilot, lambda: _finished(screen))
+
+            message = _visible_messages(screen, chat)[-1]
+            assert message._content == "".join(f"{i} " for i in range(50))
+
+    async def test_finished_message_keeps_markdown_widgets(self, app, chat) -> None:
+        """Ending the stream should not swap in a differently styled renderer."""
+        FakeAgent.script = [
+            chat.TextEvent(text="# Title\n\n"),
+            None,
+            chat.TextEvent(text="some `code`\n"),
+        ]
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._chat_queue.put_nowait("hello")
+            await _wait_for(pilot, lambda: screen._current_message is not None)
+            await pilot.pause(0.1)
+            screen._agent.release.set()
+            await _wait_for(pilot, lambda: _finished(screen))
+            await pilot.pause()
+
+            message = _visible_messages(screen, chat)[-1]
+            assert message._frozen is None
+            assert message.query("Markdown")
+
+    async def test_text_shows_while_stream_stalls(self, app, chat) -> None:
+        """Chunks received before a pause should appear without further events."""
+        FakeAgent.script = [chat.TextEvent(text="a "), chat.TextEvent(text="b"), None]
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._chat_queue.put_nowait("hello")
+            await _wait_for(pilot, lambda: screen._current_message is not None)
+            await pilot.pause(0.2)
+
+            assert screen._current_message._content == "a b"
+            screen._agent.release.set()
+
+    async def test_tool_panels_are_mounted_in_order(self, app, chat) -> None:
+        """Consecutive tool starts should be mounted together, in order."""
+        FakeAgent.script = [
+            chat.ToolStartEvent(tool_id="a", tool_name="Read", tool_input={}),
+            chat.ToolStartEvent(tool_id="b", tool_name="Edit", tool_input={}),
+            chat.ToolEndEvent(tool_id="a", result="boom", is_error=True),
+            chat.TextEvent(text="done"),
+        ]
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._chat_queue.put_nowait("hello")
+            await _wait_for(pilot, lambda: _finished(screen))
+
+            panels = [c for c in screen._container.children if isinstance(c, chat.ToolPanel)]
+            assert len(panels) == 2
+            assert screen._tool_panels == {"b": panels[1]}
+            assert screen._pending_panels == []
+
+
+class TestChatConsumer:
+    """Tests for the background chat consumer."""
+
+    async def test_consumer_survives_ui_error(self, app, chat, monkeypatch) -> None:
+        """A failure escaping _process_chat should not stall later messages."""
+        async with app.run_test() as pilot:
+            screen = app.screen
+            screen._agent.release.set()
+            original_flush = screen._flush_tool_panels
+            calls = 0
+
+            async def flaky_flush() -> None:
+                nonlocal calls
+                calls += 1
+                if calls == 1:
+                    raise RuntimeError("mount failed")
+                await original_flush()
+
+            monkeypatch.setattr(screen, "_flush_tool_panels", flaky_flush)
+
+            screen._chat_queue.put_nowait("first")
+            screen._chat_queue.put_nowait("second")
+            await _wait_for(pilot, lambda: _finished(screen, 2))
+            await pilot.pause(0.1)
+
+            roles = [m._role for m in _visible_messages(screen, chat)]
+            assert "error" in roles
+            assert roles[-1] == "assistant"
+            assert not screen._chat_task.done()
+
+
+def _stream_blocks(chat: types.ModuleType, text: str) -> tuple[list[str], str]:
+    """Feed text to a MessageView one line at a time; return split blocks and tail."""
+    view = chat.MessageView(role="assistant")
+    blocks: list[str] = []
+    for line in text.splitlines(keepends=True):
+        view._tail += line
+        blocks += view._take_completed_blocks()
+    return blocks, view._tail
+
+
+class TestMessageViewBlocks:
+    """Tests for splitting streamed markdown into completed blocks."""
+
+    def test_splits_top_level_paragraphs(self, chat) -> None:
+        """Paragraphs followed by another block should be split off."""
+        blocks, tail = _stream_blocks(chat, "# Title\nfirst\n\nsecond\n")
+
+        assert blocks == ["# Title", "first"]
+        assert tail == "second\n"
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            "1. one\n\n2. two",
+            "- item\n\n  more of the item\n\n- next",
+            "    indented\n\n    code",
+            "~~~\nfenced\n\ncode\n~~~",
+            "```\nfenced\n\ncode\n```",
+            "> quoted\n>\n> more",
+        ],
+    )
+    def test_keeps_blocks_spanning_blank_lines(self, chat, block: str) -> None:
+        """Constructs that span blank lines should stay in one block."""
+        blocks, tail = _stream_blocks(chat, f"{block}\n\nafter\n")
+
+        assert blocks == [block]
+        assert tail == "after\n"
+
+
+class TestHandleCommand:
+    """Tests for slash command dispatch."""
+
+    @pytest.mark.parametrize(
+        "message", ["/sync  LayerWise", "/sync\tLayerWise", "/sync\nLayerWise"]
+    )
+    async def test_splits_command_on_any_whitespace(self, monkeypatch, message: str) -> None:
+        """The command name should end at the first whitespace of any kind."""
+        from komorebi.ui import commands
+
+        calls: list[str] = []
+
+        async def handler(screen: Any, args: str) -> None:
+            calls.append(args)
+
+        monkeypatch.setitem(commands._HANDLERS, "/sync", handler)
+        await commands.handle_command(None, message)
+
+        assert calls == ["LayerWise"]
@@ -27,6 +27,7 @@ SdkMcpTool 的結構：
 注意：end_of_day 已整合到 project.py 的 generate_review(period="day")
 """
 
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -34,10 +35,20 @@ import pytest
 
 from komorebi.tools import planning
 
+_PROJECT_MD = b"""---
+name: Test Project
+status: active
+priority: 1
+repo: ~/test-repo
+---
+# Test Project
+"""
 
-@pytest.fixture
-def temp_data_dir(tmp_path: Path) -> Path:
-    """Create temporary data directory structure."""
+
+@pytest.fixture(scope="session")
+def _project_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the data directory structure once; the project tree is read-only."""
+    tmp_path = tmp_path_factory.mktemp("data")
     daily_dir = tmp_path / "daily"
     daily_dir.mkdir()
     projects_dir = tmp_path / "projects"
@@ -46,27 +57,54 @@ def temp_data_dir(tmp_path: Path) -> Path:
     # 建立測試專案（folder mode）
     test_project = projects_dir / "test-project"
     test_project.mkdir()
-    (test_project / "project.md").write_text(
-        """---
-name: Test Project
-status: active
-priority: 1
-repo: ~/test-repo
----
-# Test Project
-""",
-        encoding="utf-8",
-    )
+    (test_project / "project.md").write_bytes(_PROJECT_MD)
 
-    planning.set_data_dir(tmp_path)
     return tmp_path
 
 
+@pytest.fixture
+def temp_data_dir(_project_root: Path) -> Iterator[Path]:
+    """Point planning at the shared data directory and clear daily notes afterwards."""
+    planning.set_data_dir(_project_root)
+    yield _project_root
+    for note in (_project_root / "daily").iterdir():
+        note.unlink()
+
+
+@pytest.fixture
+def configured_planning(_project_root: Path) -> Path:
+    """Point planning at the shared data directory, for tests that write nothing."""
+    planning.set_data_dir(_project_root)
+    return _project_root
+
+
+@pytest.fixture
+async def planned_today(temp_data_dir: Path) -> Path:
+    """Create today's plan with highlight "Test highlight"."""
+    await planning.plan_today.handler({"highlight": "Test highlight"})
+    return temp_data_dir
+
+
+def _read_today(root: Path, today: str) -> str:
+    """Read today's daily note, failing the test if it was not created."""
+    daily_file = root / "daily" / f"{today}.md"
+    try:
+        return daily_file.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        pytest.fail(f"{daily_file} was not created")
+
+
+@pytest.fixture(autouse=True)
+def freeze_planning_time(monkeypatch: pytest.MonkeyPatch, frozen_datetime: type[datetime]) -> None:
+    """Freeze datetime.now() inside the planning module."""
+    monkeypatch.setattr(planning, "datetime", frozen_datetime)
+
+
 class TestPlanToday:
     """Tests for plan_today tool."""
 
     @pytest.mark.asyncio
-    async def test_plan_today_creates_file(self, temp_data_dir: Path) -> None:
+    async def test_plan_today_creates_file(self, temp_data_dir: Path, frozen_today: str) -> None:
         """plan_today should create daily note file."""
         result = await planning.plan_today.handler(
             {
@@ -76,17 +114,13 @@ class TestPlanToday:
         )
 
         assert result.get("is_error") is not True
-        today = datetime.now().strftime("%Y-%m-%d")
-        daily_file = temp_data_dir / "daily" / f"{today}.md"
-        assert daily_file.exists()
-
-        content = daily_file.read_text(encoding="utf-8")
+        content = _read_today(temp_data_dir, frozen_today)
         assert "Test highlight" in content
         assert "Task 1" in content
         assert "Task 2" in content
 
     @pytest.mark.asyncio
-    async def test_plan_today_requires_highlight(self, temp_data_dir: Path) -> None:
+    async def test_plan_today_requires_highlight(self, configured_planning: Path) -> None:
         """plan_today should fail without highlight."""
         result = await planning.plan_today.handler({})
 
@@ -94,11 +128,9 @@ class TestPlanToday:
         assert "Highlight" in result["content"][0]["text"]
 
     @pytest.mark.asyncio
-    async def test_plan_today_prevents_overwrite(self, temp_data_dir: Path) -> None:
+    async def test_plan_today_prevents_overwrite(self, planned_today: Path) -> None:
         """plan_today should not overwrite existing file."""
-        # 先建立一個
-        await planning.plan_today.handler({"highlight": "First"})
-        # 再試一次
+        # planned_today 已建立一個，再試一次
         result = await planning.plan_today.handler({"highlight": "Second"})
 
         assert result.get("is_error") is True
@@ -115,14 +147,14 @@ class TestPlanToday:
         assert "Active 專案" in response_text
 
     @pytest.mark.asyncio
-    async def test_plan_today_handles_empty_tasks(self, temp_data_dir: Path) -> None:
+    async def test_plan_today_handles_empty_tasks(
+        self, temp_data_dir: Path, frozen_today: str
+    ) -> None:
         """plan_today should handle missing tasks parameter."""
         result = await planning.plan_today.handler({"highlight": "Test"})
 
         assert result.get("is_error") is not True
-        today = datetime.now().strftime("%Y-%m-%d")
-        daily_file = temp_data_dir / "daily" / f"{today}.md"
-        content = daily_file.read_text(encoding="utf-8")
+        content = _read_today(temp_data_dir, frozen_today)
         assert "待填寫" in content
 
 
@@ -130,9 +162,8 @@ class TestGetToday:
     """Tests for get_today tool."""
 
     @pytest.mark.asyncio
-    async def test_get_today_returns_content(self, temp_data_dir: Path) -> None:
+    async def test_get_today_returns_content(self, planned_today: Path) -> None:
         """get_today should return existing plan."""
-        await planning.plan_today.handler({"highlight": "Test highlight"})
         result = await planning.get_today.handler({})
 
         content = result["content"][0]["text"]
@@ -140,7 +171,7 @@ class TestGetToday:
         assert result.get("is_error") is not True
 
     @pytest.mark.asyncio
-    async def test_get_today_handles_no_file(self, temp_data_dir: Path) -> None:
+    async def test_get_today_handles_no_file(self, configured_planning: Path) -> None:
         """get_today should handle missing file gracefully."""
         result = await planning.get_today.handler({})
 
@@ -153,7 +184,7 @@ class TestLogEvent:
     """Tests for log_event tool."""
 
     @pytest.mark.asyncio
-    async def test_log_event_creates_entry(self, temp_data_dir: Path) -> None:
+    async def test_log_event_creates_entry(self, temp_data_dir: Path, frozen_today: str) -> None:
         """log_event should create event entry in daily note."""
         result = await planning.log_event.handler(
             {
@@ -167,16 +198,12 @@ class TestLogEvent:
         assert "已記錄" in result["content"][0]["text"]
 
         # Check file was created/updated
-        today = datetime.now().strftime("%Y-%m-%d")
-        daily_file = temp_data_dir / "daily" / f"{today}.md"
-        assert daily_file.exists()
-
-        content = daily_file.read_text(encoding="utf-8")
+        content = _read_today(temp_data_dir, frozen_today)
         assert "Test decision" in content
         assert "Decision" in content
 
     @pytest.mark.asyncio
-    async def test_log_event_requires_summary(self, temp_data_dir: Path) -> None:
+    async def test_log_event_requires_summary(self, configured_planning: Path) -> None:
         """log_event should fail without summary."""
         result = await planning.log_event.handler(
             {
@@ -201,10 +228,9 @@ class TestHelperFunctions:
         sunday = datetime(2026, 1, 18)  # Sunday
         assert planning._get_weekday_name(sunday) == "日"
 
-    def test_get_today_file_format(self, temp_data_dir: Path) -> None:
+    def test_get_today_file_format(self, temp_data_dir: Path, frozen_today: str) -> None:
         """Should return correct file path format."""
         today_file = planning._get_today_file()
-        today = datetime.now().strftime("%Y-%m-%d")
 
-        assert today_file.name == f"{today}.md"
+        assert today_file.name == f"{frozen_today}.md"
         assert today_file.parent.name == "daily"
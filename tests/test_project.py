@@ -3,27 +3,28 @@
 精簡版：只支援 folder mode（project/project.md + tasks.md）
 """
 
-import tempfile
+import shutil
+from datetime import datetime
 from pathlib import Path
 
 import pytest
+from claude_agent_sdk.types import ResultMessage
 
 from komorebi.tools import project
 
 
-@pytest.fixture
-def temp_data_dir():
-    """Create a temporary data directory with test projects (folder mode only)."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        data_dir = Path(tmpdir)
-        projects_dir = data_dir / "projects"
-        projects_dir.mkdir()
-
-        # Create a folder mode project
-        folder_project = projects_dir / "testproject"
-        folder_project.mkdir()
-        (folder_project / "project.md").write_text(
-            """---
+@pytest.fixture(scope="module")
+def _template_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the test projects once per module (folder mode only)."""
+    data_dir = tmp_path_factory.mktemp("template")
+    projects_dir = data_dir / "projects"
+    projects_dir.mkdir()
+
+    # Create a folder mode project
+    folder_project = projects_dir / "testproject"
+    folder_project.mkdir()
+    (folder_project / "project.md").write_text(
+        """---
 name: TestProject
 type: software
 status: active
@@ -36,9 +37,9 @@ repo: ~/TestProject
 ## Goals
 Test project for unit tests.
 """
-        )
-        (folder_project / "tasks.md").write_text(
-            """## In Progress
+    )
+    (folder_project / "tasks.md").write_text(
+        """## In Progress
 - [ ] Task in progress @today
 - [ ] Another task #feature
 
@@ -48,13 +49,13 @@ Test project for unit tests.
 ## Completed
 - [x] Completed task (2026-01-14)
 """
-        )
+    )
 
-        # Create another folder mode project
-        another_project = projects_dir / "anotherproject"
-        another_project.mkdir()
-        (another_project / "project.md").write_text(
-            """---
+    # Create another folder mode project
+    another_project = projects_dir / "anotherproject"
+    another_project.mkdir()
+    (another_project / "project.md").write_text(
+        """---
 name: AnotherProject
 status: paused
 priority: 2
@@ -64,12 +65,22 @@ priority: 2
 
 A paused project.
 """
-        )
+    )
+
+    return data_dir
 
-        # Set the data directory
-        project.set_data_dir(data_dir)
 
-        yield data_dir
+@pytest.fixture
+def temp_data_dir(tmp_path: Path, _template_data_dir: Path) -> Path:
+    """Copy the template projects into a fresh data directory for each test.
+
+    許多測試會修改檔案，每個測試各自使用一份副本；
+    路徑不同，也不會沿用前一個測試的快取。
+    """
+    data_dir = tmp_path / "data"
+    shutil.copytree(_template_data_dir, data_dir)
+    project.set_data_dir(data_dir)
+    return data_dir
 
 
 class TestPathHelpers:
@@ -112,6 +123,28 @@ class TestPathHelpers:
         assert "anotherproject" in names
         assert len(projects) == 2
 
+    def test_scan_projects_records_tasks_file(self, temp_data_dir: Path) -> None:
+        """Scanning should record tasks.md only for projects that have one."""
+        entries = {name: tasks for name, _, tasks in project._scan_projects()}
+        assert entries["testproject"] is not None
+        assert entries["testproject"].name == "tasks.md"
+        assert entries["anotherproject"] is None
+
+    def test_scan_projects_sees_changes_after_cache(self, temp_data_dir: Path) -> None:
+        """A cached scan should pick up new projects and new tasks.md files."""
+        project._scan_projects()
+
+        new_project = temp_data_dir / "projects" / "newproject"
+        new_project.mkdir()
+        (new_project / "project.md").write_text("---\nname: New\n---\n", encoding="utf-8")
+        (temp_data_dir / "projects" / "anotherproject" / "tasks.md").write_text(
+            "## Pending\n- [ ] Task\n", encoding="utf-8"
+        )
+
+        entries = {name: tasks for name, _, tasks in project._scan_projects()}
+        assert "newproject" in entries
+        assert entries["anotherproject"] is not None
+
 
 class TestTaskParsing:
     """Tests for task parsing utilities."""
@@ -148,6 +181,18 @@ class TestTaskParsing:
         assert result["pending"] == []
         assert result["completed"] == []
 
+    def test_load_tasks_cached_reloads_on_change(self, temp_data_dir: Path) -> None:
+        """Cached task parsing should pick up edits to tasks.md."""
+        tasks_path = temp_data_dir / "projects" / "testproject" / "tasks.md"
+        first = project._load_tasks_cached(tasks_path)
+        assert project._load_tasks_cached(tasks_path) is first
+
+        tasks_path.write_text(tasks_path.read_text() + "- [x] Another done (2026-01-15)\n")
+        second = project._load_tasks_cached(tasks_path)
+
+        assert second is not first
+        assert len(second["completed"]) == 2
+
     def test_count_tasks(self, temp_data_dir: Path) -> None:
         """Test counting tasks for a project."""
         project_path = project._get_project_path("testproject")
@@ -247,6 +292,15 @@ class TestGetTodayTasks:
 
         # Should indicate no @today tasks
         assert "沒有標記" in text or "沒有任何" in text
+        # In-progress tasks are still listed without any @today marker
+        assert "Another task" in text
+
+    def test_load_today_tasks_skips_irrelevant_files(self, temp_data_dir: Path) -> None:
+        """Files without @today or an in-progress section should not be parsed."""
+        tasks_path = temp_data_dir / "projects" / "anotherproject" / "tasks.md"
+        tasks_path.write_text("## Pending\n- [ ] Later\n\n## Completed\n- [x] Done\n")
+
+        assert project._load_today_tasks_cached(tasks_path) is None
 
 
 class TestGenerateReview:
@@ -258,7 +312,30 @@ class TestGenerateReview:
         result = await project.generate_review.handler({"period": "day"})
 
         assert result.get("is_error") is True
-        assert "找不到" in result["content"][0]["text"] or "plan_today" in result["content"][0]["text"]
+        assert (
+            "找不到" in result["content"][0]["text"] or "plan_today" in result["content"][0]["text"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_generate_review_day_replaces_review_section(self, temp_data_dir: Path) -> None:
+        """generate_review day mode should replace the existing 日終回顧 placeholder."""
+        daily_dir = temp_data_dir / "daily"
+        daily_dir.mkdir()
+        daily_file = daily_dir / "2026-01-15.md"
+        daily_file.write_text(
+            "---\ndate: 2026-01-15\n---\n\n# 2026-01-15\n\n## 日終回顧\n(placeholder)\n",
+            encoding="utf-8",
+        )
+
+        result = await project.generate_review.handler(
+            {"period": "day", "date": "2026-01-15", "notes": "Good day"}
+        )
+
+        assert result.get("is_error") is not True
+        content = daily_file.read_text(encoding="utf-8")
+        assert content.count("## 日終回顧") == 1
+        assert "(placeholder)" not in content
+        assert "Good day" in content
 
     @pytest.mark.asyncio
     async def test_generate_review_week_creates_file(self, temp_data_dir: Path) -> None:
@@ -285,3 +362,137 @@ class TestGenerateReview:
         assert result.get("is_error") is not True
         text = result["content"][0]["text"]
         assert "月回顧" in text
+
+    @pytest.mark.asyncio
+    async def test_generate_review_month_lists_completed(self, temp_data_dir: Path) -> None:
+        """generate_review month mode should list tasks completed in that month."""
+        result = await project.generate_review.handler({"period": "month", "date": "2026-01"})
+
+        assert result.get("is_error") is not True
+        review_file = temp_data_dir / "reviews" / "monthly" / "2026-01.md"
+        content = review_file.read_text(encoding="utf-8")
+        assert "- [x] Completed task" in content
+        assert "**TestProject**: 1/4 tasks" in content
+
+    @pytest.mark.asyncio
+    async def test_generate_review_month_skips_unreadable_tasks(self, temp_data_dir: Path) -> None:
+        """One unreadable tasks.md should not abort the month review."""
+        broken = temp_data_dir / "projects" / "anotherproject" / "tasks.md"
+        broken.write_bytes(b"## Pending\n- [ ] \xff\xfe\n")
+
+        result = await project.generate_review.handler({"period": "month", "date": "2026-01"})
+
+        assert result.get("is_error") is not True
+        review_file = temp_data_dir / "reviews" / "monthly" / "2026-01.md"
+        content = review_file.read_text(encoding="utf-8")
+        assert "**TestProject**: 1/4 tasks" in content
+        assert "**AnotherProject**: 0 tasks" in content
+
+
+class TestGetDateRange:
+    """Tests for _get_date_range helper."""
+
+    def test_day_range(self) -> None:
+        """Day range should cover the whole given day."""
+        start, end, label = project._get_date_range(project.ReviewPeriod.DAY, "2026-01-15")
+        assert start == datetime(2026, 1, 15)
+        assert end == datetime(2026, 1, 15, 23, 59, 59, 999999)
+        assert label == "2026-01-15"
+
+    @pytest.mark.parametrize("date_str", ["20260115", "2026-01-15T10:00", "2026-W03-4"])
+    def test_day_rejects_other_iso_formats(self, date_str: str) -> None:
+        """Day reviews should only accept YYYY-MM-DD."""
+        with pytest.raises(ValueError):
+            project._get_date_range(project.ReviewPeriod.DAY, date_str)
+
+    def test_week_range(self) -> None:
+        """Week range should start on Monday and keep the YYYY-Www label."""
+        start, end, label = project._get_date_range(project.ReviewPeriod.WEEK, "2026-W02")
+        assert start == datetime(2026, 1, 12)
+        assert end == datetime(2026, 1, 18, 23, 59, 59, 999999)
+        assert label == "2026-W02"
+
+    def test_month_range(self) -> None:
+        """Month range should end on the month's last day."""
+        start, end, label = project._get_date_range(project.ReviewPeriod.MONTH, "2024-02")
+        assert start == datetime(2024, 2, 1)
+        assert end == datetime(2024, 2, 29, 23, 59, 59, 999999)
+        assert label == "2024-02"
+
+    def test_defaults_to_today(self) -> None:
+        """Without a date, the day range should be today."""
+        _, _, label = project._get_date_range(project.ReviewPeriod.DAY, None)
+        assert label == datetime.now().strftime("%Y-%m-%d")
+
+
+# 只讀取 result 欄位，用真正的 ResultMessage 即可，不需要記錄呼叫的 MagicMock
+_REFLECTION_RESULT = ResultMessage(
+    subtype="success",
+    duration_ms=0,
+    duration_api_ms=0,
+    is_error=False,
+    num_turns=1,
+    session_id="test",
+    result="- 這週最有成就感的是什麼？",
+)
+
+
+class TestGenerateReflectionQuestions:
+    """Tests for _generate_reflection_questions helper."""
+
+    @pytest.fixture
+    def fake_query(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Replace the Claude query with a stub that records prompts."""
+        prompts: list[str] = []
+
+        async def _query(prompt: str, options: object):
+            prompts.append(prompt)
+            yield _REFLECTION_RESULT
+
+        monkeypatch.setattr(project, "query", _query)
+        monkeypatch.setattr(project, "_reflection_cache", {})
+        return prompts
+
+    @pytest.mark.asyncio
+    async def test_skips_query_without_work(self, fake_query: list[str]) -> None:
+        """Nothing to reflect on should return the default question without a query."""
+        result = await project._generate_reflection_questions({}, {})
+
+        assert "下週" in result
+        assert fake_query == []
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_for_same_summary(self, fake_query: list[str]) -> None:
+        """Generating questions twice for the same work should query only once."""
+        completed = {"testproject": [{"text": "Completed task"}]}
+
+        first = await project._generate_reflection_questions(completed, {})
+        second = await project._generate_reflection_questions(completed, {})
+
+        assert first == second == "- 這週最有成就感的是什麼？"
+        assert len(fake_query) == 1
+
+
+class TestCollectCompletedTasks:
+    """Tests for _collect_completed_tasks_in_range helper."""
+
+    @pytest.mark.asyncio
+    async def test_collects_tasks_in_range(self, temp_data_dir: Path) -> None:
+        """Completed tasks dated inside the range should be collected per project."""
+        start = datetime(2026, 1, 12)
+        end = datetime(2026, 1, 18, 23, 59, 59)
+
+        result = await project._collect_completed_tasks_in_range(start, end)
+
+        assert list(result) == ["testproject"]
+        assert result["testproject"][0]["text"] == "Completed task"
+
+    @pytest.mark.asyncio
+    async def test_skips_tasks_out_of_range(self, temp_data_dir: Path) -> None:
+        """Projects without completed tasks in range should be omitted."""
+        start = datetime(2026, 2, 1)
+        end = datetime(2026, 2, 28, 23, 59, 59)
+
+        result = await project._collect_completed_tasks_in_range(start, end)
+
+        assert result == {}
@@ -90,6 +90,46 @@ class TestSkillManager:
         assert minimal_skill.name == "minimal-skill"
         assert minimal_skill.description == ""
 
+    def test_discover_parses_quoted_and_folded_values(self, temp_skills_dir: Path) -> None:
+        """Quoted and folded frontmatter values should parse as YAML."""
+        quoted_skill = temp_skills_dir / "quoted-skill"
+        quoted_skill.mkdir()
+        (quoted_skill / "SKILL.md").write_text(
+            "---\nname: 'quoted-skill'\ndescription: >\n  folded\n  text\n---\n"
+        )
+        manager = SkillManager(temp_skills_dir)
+        manager.discover()
+
+        skill = manager._skills["quoted-skill"]
+        assert skill.description == "folded text\n"
+
+    def test_discover_reads_frontmatter_past_prefix(self, temp_skills_dir: Path) -> None:
+        """A frontmatter longer than the read prefix should still parse fully."""
+        long_skill = temp_skills_dir / "long-skill"
+        long_skill.mkdir()
+        description = "技能說明" * 400
+        (long_skill / "SKILL.md").write_text(
+            f"---\nname: long-skill\ndescription: |-\n  {description}\n---\n\n# Long\n",
+            encoding="utf-8",
+        )
+        manager = SkillManager(temp_skills_dir)
+        manager.discover()
+
+        assert manager._skills["long-skill"].description == description
+
+    def test_discover_many_skills(self, temp_skills_dir: Path) -> None:
+        """Large skill trees (read in parallel) should find every skill."""
+        for i in range(10):
+            skill_dir = temp_skills_dir / f"skill-{i}"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_text(f"---\nname: skill-{i}\n---\n")
+        (temp_skills_dir / "no-skill-file").mkdir()
+
+        manager = SkillManager(temp_skills_dir)
+        names = {s.name for s in manager.discover()}
+
+        assert names == {"test-skill", "minimal-skill"} | {f"skill-{i}" for i in range(10)}
+
     def test_discover_empty_directory(self) -> None:
         """Test discover() with non-existent directory."""
         manager = SkillManager(Path("/nonexistent/path"))
@@ -122,6 +162,18 @@ class TestSkillManager:
 
         assert prompt == ""
 
+    def test_get_skill_list_prompt_refreshes_after_discover(self, temp_skills_dir: Path) -> None:
+        """The cached prompt should pick up skills found by a later discover()."""
+        manager = SkillManager(temp_skills_dir)
+        assert "`new-skill`" not in manager.get_skill_list_prompt()
+
+        new_skill = temp_skills_dir / "new-skill"
+        new_skill.mkdir()
+        (new_skill / "SKILL.md").write_text("---\nname: new-skill\n---\n")
+        manager.discover()
+
+        assert "`new-skill`" in manager.get_skill_list_prompt()
+
     def test_load_skill_content(self, temp_skills_dir: Path) -> None:
         """Test load_skill_content() returns full SKILL.md content."""
         manager = SkillManager(temp_skills_dir)
@@ -143,6 +195,13 @@ class TestSkillManager:
 
         assert content is None
 
+    def test_discovers_on_first_use(self, temp_skills_dir: Path) -> None:
+        """Skills should be discovered lazily when discover() was not called."""
+        manager = SkillManager(temp_skills_dir)
+
+        assert "`test-skill`" in manager.get_skill_list_prompt()
+        assert manager.load_skill_content("minimal-skill") is not None
+
     def test_list_available_skills(self, temp_skills_dir: Path) -> None:
         """Test list_available_skills() returns skill names."""
         manager = SkillManager(temp_skills_dir)
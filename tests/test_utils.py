@@ -0,0 +1,195 @@
+"""Tests for shared utilities."""
+
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from komorebi.utils import (
+    get_today_commits,
+    load_frontmatter,
+    load_frontmatter_readonly,
+    read_file_safely,
+    run_git_command_lines,
+    save_frontmatter,
+    write_file_atomic,
+)
+
+
+class TestLoadFrontmatterCache:
+    """Tests for the (path, mtime, size) keyed frontmatter cache."""
+
+    def test_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Modifying a loaded post should not leak into later loads."""
+        file_path = tmp_path / "project.md"
+        file_path.write_text("---\nname: demo\ntags: [a]\n---\nbody\n", encoding="utf-8")
+
+        post = load_frontmatter(file_path)
+        post["tags"].append("b")
+
+        assert load_frontmatter(file_path)["tags"] == ["a"]
+
+    def test_reloads_after_save(self, tmp_path: Path) -> None:
+        """Saved changes should be visible on the next load."""
+        file_path = tmp_path / "project.md"
+        file_path.write_text("---\nstatus: active\n---\nbody\n", encoding="utf-8")
+
+        post = load_frontmatter(file_path)
+        post["status"] = "paused"
+        save_frontmatter(file_path, post)
+
+        assert load_frontmatter(file_path)["status"] == "paused"
+
+    def test_readonly_shares_cache_and_sees_saves(self, tmp_path: Path) -> None:
+        """The read-only loader should reuse one Post until the file is saved."""
+        file_path = tmp_path / "project.md"
+        file_path.write_text("---\nstatus: active\n---\nbody\n", encoding="utf-8")
+
+        first = load_frontmatter_readonly(file_path)
+        assert load_frontmatter_readonly(file_path) is first
+
+        post = load_frontmatter(file_path)
+        post["status"] = "paused"
+        save_frontmatter(file_path, post)
+
+        assert load_frontmatter_readonly(file_path)["status"] == "paused"
+
+
+class TestReadFileSafely:
+    """Tests for read_file_safely."""
+
+    def test_missing_file_returns_empty(self, tmp_path: Path) -> None:
+        """Missing files should read as empty string."""
+        assert read_file_safely(tmp_path / "missing.md") == ""
+
+    def test_cache_keyed_by_max_chars(self, tmp_path: Path) -> None:
+        """Different limits on the same file should not share a cached result."""
+        file_path = tmp_path / "README.md"
+        file_path.write_text("x" * 20, encoding="utf-8")
+
+        assert read_file_safely(file_path, max_chars=10) == "x" * 10 + "\n...(truncated)"
+        assert read_file_safely(file_path) == "x" * 20
+
+    def test_truncates_multibyte_content(self, tmp_path: Path) -> None:
+        """Truncation should count characters, not bytes."""
+        file_path = tmp_path / "notes.md"
+        file_path.write_text("日誌" * 100, encoding="utf-8")
+
+        assert read_file_safely(file_path, max_chars=5) == "日誌日誌日\n...(truncated)"
+
+    def test_concurrent_use_from_threads(self, tmp_path: Path) -> None:
+        """Threads filling, evicting and invalidating the cache should not fail."""
+        files = []
+        for i in range(300):
+            file_path = tmp_path / f"{i}.md"
+            file_path.write_text(f"---\nn: {i}\n---\nbody {i}\n", encoding="utf-8")
+            files.append(file_path)
+
+        def work(offset: int) -> None:
+            own = set(files[offset : offset + 40])
+            for file_path in files[offset:] + files[:offset]:
+                read_file_safely(file_path)
+                load_frontmatter(file_path)
+                if file_path in own:
+                    write_file_atomic(file_path, file_path.read_bytes())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(0, 300, 40)))
+
+
+class TestWriteFileAtomic:
+    """Tests for write_file_atomic."""
+
+    def test_concurrent_writes_leave_one_complete_file(self, tmp_path: Path) -> None:
+        """Concurrent writers should not clobber each other's temp files."""
+        file_path = tmp_path / "review.md"
+        payloads = [bytes([ord("a") + i]) * 100_000 for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda data: write_file_atomic(file_path, data), payloads))
+
+        assert file_path.read_bytes() in payloads
+        assert [p.name for p in tmp_path.iterdir()] == ["review.md"]
+
+    def test_keeps_permissions(self, tmp_path: Path) -> None:
+        """Rewriting a file should not reset its mode to the umask default."""
+        file_path = tmp_path / "project.md"
+        file_path.write_bytes(b"old")
+        file_path.chmod(0o600)
+
+        write_file_atomic(file_path, b"new")
+
+        assert file_path.read_bytes() == b"new"
+        assert file_path.stat().st_mode & 0o777 == 0o600
+
+    def test_writes_through_symlink(self, tmp_path: Path) -> None:
+        """A symlinked file should stay a symlink and its target should be updated."""
+        target = tmp_path / "real" / "tasks.md"
+        target.parent.mkdir()
+        target.write_bytes(b"old")
+        link = tmp_path / "tasks.md"
+        link.symlink_to(target)
+
+        write_file_atomic(link, b"new")
+
+        assert link.is_symlink()
+        assert target.read_bytes() == b"new"
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestTodayCommitsCache:
+    """Tests for the HEAD-keyed today's commits cache."""
+
+    @pytest.mark.asyncio
+    async def test_new_commit_invalidates_cache(self, tmp_path: Path) -> None:
+        """A commit that moves HEAD should show up on the next call."""
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "first")
+
+        assert [c.split(" (")[0] for c in await get_today_commits(tmp_path)] == ["first"]
+
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "second")
+        commits = await get_today_commits(tmp_path)
+
+        assert [c.split(" (")[0] for c in commits] == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_not_a_repo_returns_empty(self, tmp_path: Path) -> None:
+        """Directories without a repository should yield no commits."""
+        assert await get_today_commits(tmp_path) == []
+
+
+class TestRunGitCommandLines:
+    """Tests for the streaming git helper."""
+
+    @pytest.mark.asyncio
+    async def test_long_line_is_yielded(self, tmp_path: Path) -> None:
+        """Lines over asyncio's default 64 KiB limit should still be read."""
+        _git(tmp_path, "init", "-q")
+        message = "x" * 100_000
+        _git(tmp_path, "commit", "-q", "--allow-empty", "-m", message)
+
+        lines = [line async for line in run_git_command_lines(tmp_path, ["log", "--format=%s"])]
+
+        assert lines == [message]
+
+    @pytest.mark.asyncio
+    async def test_failed_command_logs_warning(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """A non-zero exit status should be logged instead of passing silently."""
+        _git(tmp_path, "init", "-q")
+
+        lines = [line async for line in run_git_command_lines(tmp_path, ["log", "no-such-ref"])]
+
+        assert lines == []
+        assert "Git command exited with" in caplog.text